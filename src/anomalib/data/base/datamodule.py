@@ -6,13 +6,22 @@
 
 import logging
 from abc import ABC
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
+import torch
 from lightning.pytorch import LightningDataModule
 from lightning.pytorch.utilities.types import EVAL_DATALOADERS, TRAIN_DATALOADERS
 from torch.utils.data.dataloader import DataLoader, default_collate
 
-from anomalib.data.utils import TestSplitMode, ValSplitMode, random_split, split_by_label
+from anomalib.data.utils import (
+    TestSplitMode,
+    ValSplitMode,
+    get_subset_lengths,
+    random_split,
+    random_split_by_lengths,
+    split_by_label,
+)
 from anomalib.data.utils.synthetic import SyntheticAnomalyDataset
 
 if TYPE_CHECKING:
@@ -23,27 +32,41 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def collate_fn(batch: list) -> dict[str, Any]:
+def collate_fn(batch: list, memory_format: torch.memory_format = torch.contiguous_format) -> dict[str, Any]:
     """Collate bounding boxes as lists.
 
     Bounding boxes are collated as a list of tensors, while the default collate function is used for all other entries.
 
     Args:
         batch (List): list of items in the batch where len(batch) is equal to the batch size.
+        memory_format (torch.memory_format): Memory format of the collated 4D floating point tensors (e.g. the images).
+            Defaults to ``torch.contiguous_format``.
 
     Returns:
         dict[str, Any]: Dictionary containing the collated batch information.
     """
     elem = batch[0]  # sample an element from the batch to check the type.
+    if not isinstance(elem, dict):
+        return default_collate(batch)
+
+    # gather the values of all keys in a single pass over the batch.
+    buckets: dict[str, list] = {key: [None] * len(batch) for key in elem}
+    for index, item in enumerate(batch):
+        for key, values in buckets.items():
+            values[index] = item[key]
+
     out_dict = {}
-    if isinstance(elem, dict):
-        if "boxes" in elem:
-            # collate boxes as list
-            out_dict["boxes"] = [item.pop("boxes") for item in batch]
-        # collate other data normally
-        out_dict.update({key: default_collate([item[key] for item in batch]) for key in elem})
-        return out_dict
-    return default_collate(batch)
+    # collate boxes as list
+    if "boxes" in buckets:
+        out_dict["boxes"] = buckets.pop("boxes")
+    # collate other data normally
+    for key, values in buckets.items():
+        value = default_collate(values)
+        # convert the layout of the image batches, so that this is done by the workers rather than the model.
+        if isinstance(value, torch.Tensor) and value.ndim == 4 and value.is_floating_point():
+            value = value.contiguous(memory_format=memory_format)
+        out_dict[key] = value
+    return out_dict
 
 
 class AnomalibDataModule(LightningDataModule, ABC):
@@ -63,6 +86,19 @@ class AnomalibDataModule(LightningDataModule, ABC):
             Defaults to ``None``.
         seed (int | None, optional): Seed used during random subset splitting.
             Defaults to ``None``.
+        pin_memory (bool): Copy batches into page-locked memory so that host-to-device transfers can be performed
+            asynchronously (``tensor.to(device, non_blocking=True)``). Only applied when CUDA is available.
+            Defaults to ``True``.
+        persistent_workers (bool): Keep the dataloader worker processes alive between epochs instead of respawning
+            them. Only applied when ``num_workers > 0``.
+            Defaults to ``True``.
+        prefetch_factor (int | None): Number of batches loaded in advance by each worker. Only applied when
+            ``num_workers > 0``.
+            Defaults to ``2``.
+        channels_last (bool): Return the batched images in ``torch.channels_last`` memory format, which speeds up the
+            convolutions of most backbones on recent CPUs and GPUs. The conversion is done by the dataloader workers,
+            and only applies to 4D image batches, so video clips keep their layout.
+            Defaults to ``False``.
     """
 
     def __init__(
@@ -75,6 +111,10 @@ class AnomalibDataModule(LightningDataModule, ABC):
         test_split_mode: TestSplitMode | str | None = None,
         test_split_ratio: float | None = None,
         seed: int | None = None,
+        pin_memory: bool = True,
+        persistent_workers: bool = True,
+        prefetch_factor: int | None = 2,
+        channels_last: bool = False,
     ) -> None:
         super().__init__()
         self.train_batch_size = train_batch_size
@@ -85,6 +125,10 @@ class AnomalibDataModule(LightningDataModule, ABC):
         self.val_split_mode = ValSplitMode(val_split_mode)
         self.val_split_ratio = val_split_ratio
         self.seed = seed
+        self.pin_memory = pin_memory
+        self.persistent_workers = persistent_workers
+        self.prefetch_factor = prefetch_factor
+        self.memory_format = torch.channels_last if channels_last else torch.contiguous_format
 
         self.train_data: AnomalibDataset
         self.val_data: AnomalibDataset
@@ -121,11 +165,17 @@ class AnomalibDataModule(LightningDataModule, ABC):
         self.train_data.setup()
         self.test_data.setup()
 
-        self._create_test_split()
-        self._create_val_split()
+        normal_val_data = self._create_test_split()
+        self._create_val_split(normal_val_data)
+
+    def _create_test_split(self) -> "AnomalibDataset | None":
+        """Obtain the test set based on the settings in the config.
 
-    def _create_test_split(self) -> None:
-        """Obtain the test set based on the settings in the config."""
+        Returns:
+            AnomalibDataset | None: Normal images sampled from the training set for the synthetic validation set, when
+                they are sampled together with the normal test images. ``None`` otherwise.
+        """
+        normal_val_data = None
         if self.test_data.has_normal:
             # split the test data into normal and anomalous so these can be processed separately
             normal_test_data, self.test_data = split_by_label(self.test_data)
@@ -136,7 +186,24 @@ class AnomalibDataModule(LightningDataModule, ABC):
                 "No normal test images found. Sampling from training set using a split ratio of %0.2f",
                 self.test_split_ratio,
             )
-            if self.test_split_ratio is not None:
+            if self.test_split_ratio is not None and self.val_split_mode == ValSplitMode.SYNTHETIC:
+                # the normal validation images are also sampled from the training set. Draw both subsets with a single
+                # split, so that the training set is only shuffled once. The subset lengths are those of two
+                # consecutive splits, the first one holding out the test images and the second one the val images.
+                train_length, test_length = get_subset_lengths(
+                    len(self.train_data),
+                    [1 - self.test_split_ratio, self.test_split_ratio],
+                )
+                train_length, val_length = get_subset_lengths(
+                    train_length,
+                    [1 - self.val_split_ratio, self.val_split_ratio],
+                )
+                self.train_data, normal_test_data, normal_val_data = random_split_by_lengths(
+                    self.train_data,
+                    [train_length, test_length, val_length],
+                    seed=self.seed,
+                )
+            elif self.test_split_ratio is not None:
                 self.train_data, normal_test_data = random_split(self.train_data, self.test_split_ratio, seed=self.seed)
 
         if self.test_split_mode == TestSplitMode.FROM_DIR:
@@ -146,9 +213,16 @@ class AnomalibDataModule(LightningDataModule, ABC):
         elif self.test_split_mode != TestSplitMode.NONE:
             msg = f"Unsupported Test Split Mode: {self.test_split_mode}"
             raise ValueError(msg)
+        return normal_val_data
+
+    def _create_val_split(self, normal_val_data: "AnomalibDataset | None" = None) -> None:
+        """Obtain the validation set based on the settings in the config.
 
-    def _create_val_split(self) -> None:
-        """Obtain the validation set based on the settings in the config."""
+        Args:
+            normal_val_data (AnomalibDataset | None): Normal images already sampled from the training set for the
+                synthetic validation set. They are sampled from the training set if ``None``.
+                Defaults to ``None``.
+        """
         if self.val_split_mode == ValSplitMode.FROM_TEST:
             # randomly sampled from test set
             self.test_data, self.val_data = random_split(
@@ -161,8 +235,9 @@ class AnomalibDataModule(LightningDataModule, ABC):
             # equal to test set
             self.val_data = self.test_data
         elif self.val_split_mode == ValSplitMode.SYNTHETIC:
-            # converted from random training sample
-            self.train_data, normal_val_data = random_split(self.train_data, self.val_split_ratio, seed=self.seed)
+            # converted from random training sample, unless already sampled together with the test set
+            if normal_val_data is None:
+                self.train_data, normal_val_data = random_split(self.train_data, self.val_split_ratio, seed=self.seed)
             self.val_data = SyntheticAnomalyDataset.from_dataset(normal_val_data)
         elif self.val_split_mode != ValSplitMode.NONE:
             msg = f"Unknown validation split mode: {self.val_split_mode}"
@@ -174,12 +249,26 @@ class AnomalibDataModule(LightningDataModule, ABC):
 
         At least one of [train_data, val_data, test_data] should be setup.
         """
-        _is_setup: bool = False
-        for data in ("train_data", "val_data", "test_data"):
-            if hasattr(self, data) and getattr(self, data).is_setup:
-                _is_setup = True
+        return any(
+            hasattr(self, data) and getattr(self, data).is_setup for data in ("train_data", "val_data", "test_data")
+        )
 
-        return _is_setup
+    @property
+    def _dataloader_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments shared by the train, val and test dataloaders.
+
+        ``persistent_workers`` and ``prefetch_factor`` are only valid when worker processes are used, and pinning memory
+        is only useful (and on some platforms only safe) when batches are moved to a CUDA device.
+        """
+        kwargs: dict[str, Any] = {
+            "num_workers": self.num_workers,
+            "pin_memory": self.pin_memory and torch.cuda.is_available(),
+            "collate_fn": partial(collate_fn, memory_format=self.memory_format),
+        }
+        if self.num_workers > 0:
+            kwargs["persistent_workers"] = self.persistent_workers
+            kwargs["prefetch_factor"] = self.prefetch_factor
+        return kwargs
 
     def train_dataloader(self) -> TRAIN_DATALOADERS:
         """Get train dataloader."""
@@ -187,7 +276,7 @@ class AnomalibDataModule(LightningDataModule, ABC):
             dataset=self.train_data,
             shuffle=True,
             batch_size=self.train_batch_size,
-            num_workers=self.num_workers,
+            **self._dataloader_kwargs,
         )
 
     def val_dataloader(self) -> EVAL_DATALOADERS:
@@ -196,8 +285,7 @@ class AnomalibDataModule(LightningDataModule, ABC):
             dataset=self.val_data,
             shuffle=False,
             batch_size=self.eval_batch_size,
-            num_workers=self.num_workers,
-            collate_fn=collate_fn,
+            **self._dataloader_kwargs,
         )
 
     def test_dataloader(self) -> EVAL_DATALOADERS:
@@ -206,8 +294,7 @@ class AnomalibDataModule(LightningDataModule, ABC):
             dataset=self.test_data,
             shuffle=False,
             batch_size=self.eval_batch_size,
-            num_workers=self.num_workers,
-            collate_fn=collate_fn,
+            **self._dataloader_kwargs,
         )
 
     def predict_dataloader(self) -> EVAL_DATALOADERS:
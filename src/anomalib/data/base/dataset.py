@@ -45,6 +45,7 @@ class AnomalibDataset(Dataset, ABC):
         self.task = task
         self.transform = transform
         self._samples: DataFrame
+        self._sample_columns: dict[str, np.ndarray]
 
     def __len__(self) -> int:
         """Get length of the dataset."""
@@ -89,9 +90,22 @@ class AnomalibDataset(Dataset, ABC):
         assert all(
             col in samples.columns for col in expected_columns
         ), f"samples must have (at least) columns {expected_columns}, found {samples.columns}"
-        assert samples["image_path"].apply(lambda p: Path(p).exists()).all(), "missing file path(s) in samples"
+        assert samples["image_path"].apply(self._image_exists).all(), "missing file path(s) in samples"
 
         self._samples = samples.sort_values(by="image_path", ignore_index=True)
+        # Keep the columns as NumPy arrays, so that fetching an item does not construct a pandas row.
+        self._sample_columns = {column: self._samples[column].to_numpy() for column in self._samples.columns}
+
+    def _image_exists(self, image_path: str) -> bool:
+        """Check if the image file of a sample exists.
+
+        Args:
+            image_path (str): Path to the image file.
+
+        Returns:
+            bool: True if the image file exists.
+        """
+        return Path(image_path).exists()
 
     @property
     def has_normal(self) -> bool:
@@ -113,9 +127,9 @@ class AnomalibDataset(Dataset, ABC):
             dict[str, str | torch.Tensor]: Dict of image tensor during training. Otherwise, Dict containing image path,
                 target path, image tensor, label and transformed bounding box.
         """
-        image_path = self._samples.iloc[index].image_path
-        mask_path = self._samples.iloc[index].mask_path
-        label_index = self._samples.iloc[index].label_index
+        image_path = self._sample_columns["image_path"][index]
+        mask_path = self._sample_columns["mask_path"][index]
+        label_index = self._sample_columns["label_index"][index]
 
         image = read_image(image_path)
         item = {"image_path": image_path, "label": label_index}
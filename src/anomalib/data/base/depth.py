@@ -35,10 +35,10 @@ class AnomalibDepthDataset(AnomalibDataset, ABC):
         Returns:
             dict[str, str | torch.Tensor]: Dictionary containing the image, depth image and mask.
         """
-        image_path = self._samples.iloc[index].image_path
-        mask_path = self._samples.iloc[index].mask_path
-        label_index = self._samples.iloc[index].label_index
-        depth_path = self._samples.iloc[index].depth_path
+        image_path = self._sample_columns["image_path"][index]
+        mask_path = self._sample_columns["mask_path"][index]
+        label_index = self._sample_columns["label_index"][index]
+        depth_path = self._sample_columns["depth_path"][index]
 
         image = read_image(image_path)
         depth_image = read_depth_image(depth_path)
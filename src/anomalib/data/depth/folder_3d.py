@@ -7,10 +7,15 @@ This script creates a custom dataset from a folder.
 # SPDX-License-Identifier: Apache-2.0
 
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
 import albumentations as A  # noqa: N812
-from pandas import DataFrame, isna
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, RangeIndex, Series, notna
 
 from anomalib import TaskType
 from anomalib.data.base import AnomalibDataModule, AnomalibDepthDataset
@@ -25,6 +30,21 @@ from anomalib.data.utils import (
 )
 from anomalib.data.utils.path import _prepare_files_labels, validate_and_resolve_path
 
+# Matches the file name without its (last) extension, i.e. the equivalent of ``Path.stem``.
+_STEM_PATTERN = r"([^/\\]+?)(?:\.[^.]*)?$"
+
+# Maximum number of threads used to scan the dataset directories.
+_MAX_SCAN_WORKERS = 8
+
+# Environment variable that enables the validation of the depth files when creating the dataset.
+_VALIDATE_FILES_ENV = "ANOMALIB_VALIDATE_FILES"
+
+# Integer codes of the directory types and splits, used to build the samples with vectorized comparisons.
+_DIRTYPES = np.array(list(DirType), dtype=object)
+_DIRTYPE_CODES = {dir_type: code for code, dir_type in enumerate(DirType)}
+_SPLITS = np.array(list(Split), dtype=object)
+_SPLIT_CODES = {split: code for code, split in enumerate(Split)}
+
 
 def make_folder3d_dataset(
     normal_dir: str | Path,
@@ -65,122 +85,176 @@ def make_folder3d_dataset(
         extensions (tuple[str, ...] | None, optional): Type of the image extensions to read from the directory.
             Defaults to ``None``.
 
+    Note:
+        Checking that every rgb image has a matching depth image, and that the depth files exist, requires a pass over
+        all the files of the dataset. These checks are therefore skipped unless the ``ANOMALIB_VALIDATE_FILES``
+        environment variable is set to ``1``.
+
     Returns:
         DataFrame: an output dataframe containing samples for the requested split (ie., train or test)
     """
-    normal_dir = validate_and_resolve_path(normal_dir, root)
-    abnormal_dir = validate_and_resolve_path(abnormal_dir, root) if abnormal_dir else None
-    normal_test_dir = validate_and_resolve_path(normal_test_dir, root) if normal_test_dir else None
-    mask_dir = validate_and_resolve_path(mask_dir, root) if mask_dir else None
-    normal_depth_dir = validate_and_resolve_path(normal_depth_dir, root) if normal_depth_dir else None
-    abnormal_depth_dir = validate_and_resolve_path(abnormal_depth_dir, root) if abnormal_depth_dir else None
-    normal_test_depth_dir = validate_and_resolve_path(normal_test_depth_dir, root) if normal_test_depth_dir else None
-
-    assert normal_dir.is_dir(), "A folder location must be provided in normal_dir."
-
-    filenames = []
-    labels = []
-    dirs = {DirType.NORMAL: normal_dir}
+    return _filter_split(
+        _build_full_samples(
+            normal_dir=normal_dir,
+            root=root,
+            abnormal_dir=abnormal_dir,
+            normal_test_dir=normal_test_dir,
+            mask_dir=mask_dir,
+            normal_depth_dir=normal_depth_dir,
+            abnormal_depth_dir=abnormal_depth_dir,
+            normal_test_depth_dir=normal_test_depth_dir,
+            extensions=extensions,
+        ),
+        split,
+    )
 
-    if abnormal_dir:
-        dirs[DirType.ABNORMAL] = abnormal_dir
 
-    if normal_test_dir:
-        dirs[DirType.NORMAL_TEST] = normal_test_dir
+def _build_full_samples(
+    normal_dir: str | Path,
+    root: str | Path | None = None,
+    abnormal_dir: str | Path | None = None,
+    normal_test_dir: str | Path | None = None,
+    mask_dir: str | Path | None = None,
+    normal_depth_dir: str | Path | None = None,
+    abnormal_depth_dir: str | Path | None = None,
+    normal_test_depth_dir: str | Path | None = None,
+    extensions: tuple[str, ...] | None = None,
+) -> DataFrame:
+    """Build the samples of all the splits of a Folder3D dataset.
 
-    if normal_depth_dir:
-        dirs[DirType.NORMAL_DEPTH] = normal_depth_dir
+    See ``make_folder3d_dataset`` for the description of the arguments.
 
-    if abnormal_depth_dir:
-        dirs[DirType.ABNORMAL_DEPTH] = abnormal_depth_dir
+    Returns:
+        DataFrame: an output dataframe containing the samples of all the splits.
+    """
+    # validate all the provided directories, and map them to their directory type.
+    dirs = {DirType.NORMAL: validate_and_resolve_path(normal_dir, root)}
+    dirs.update(
+        {
+            dir_type: validate_and_resolve_path(path, root)
+            for dir_type, path in (
+                (DirType.ABNORMAL, abnormal_dir),
+                (DirType.NORMAL_TEST, normal_test_dir),
+                (DirType.NORMAL_DEPTH, normal_depth_dir),
+                (DirType.ABNORMAL_DEPTH, abnormal_depth_dir),
+                (DirType.NORMAL_TEST_DEPTH, normal_test_depth_dir),
+                (DirType.MASK, mask_dir),
+            )
+            if path
+        },
+    )
+
+    assert dirs[DirType.NORMAL].is_dir(), "A folder location must be provided in normal_dir."
+
+    # scanning the directories is I/O bound, so the directories are scanned concurrently.
+    with ThreadPoolExecutor(max_workers=min(_MAX_SCAN_WORKERS, len(dirs))) as executor:
+        results = list(
+            executor.map(
+                lambda item: _prepare_files_labels(item[1], item[0], extensions),
+                dirs.items(),
+            ),
+        )
 
-    if normal_test_depth_dir:
-        dirs[DirType.NORMAL_TEST_DEPTH] = normal_test_depth_dir
+    # concatenate the per-directory results into a single allocation, and label the files with the int8 code of
+    # their directory type so that the row masks below are vectorized integer comparisons.
+    filenames = list(chain.from_iterable(filename for filename, _ in results))
+    label_codes = np.repeat(
+        np.array([_DIRTYPE_CODES[dir_type] for dir_type in dirs], dtype=np.int8),
+        [len(filename) for filename, _ in results],
+    )
+
+    # sort the files before creating the dataframe, rather than sorting the dataframe itself. The columns are passed
+    # as typed arrays, so that pandas does not need to infer their dtypes.
+    image_paths = np.asarray(filenames, dtype=object)
+    order = np.argsort(image_paths, kind="stable")
+    image_paths = image_paths[order]
+    label_codes = label_codes[order]
+    samples = DataFrame(
+        {"image_path": image_paths, "label": label_codes},
+        index=RangeIndex(len(image_paths)),
+        copy=False,
+    )
+
+    is_dir_type = {dir_type: label_codes == code for dir_type, code in _DIRTYPE_CODES.items()}
+    is_normal = is_dir_type[DirType.NORMAL]
+    is_abnormal = is_dir_type[DirType.ABNORMAL]
+    is_normal_test = is_dir_type[DirType.NORMAL_TEST]
 
-    if mask_dir:
-        dirs[DirType.MASK] = mask_dir
+    # Create label index for normal (0) and abnormal (1) images.
+    label_index = np.where(is_abnormal, LabelName.ABNORMAL, LabelName.NORMAL)
+    columns: dict[str, np.ndarray] = {}
 
-    for dir_type, path in dirs.items():
-        filename, label = _prepare_files_labels(path, dir_type, extensions)
-        filenames += filename
-        labels += label
+    # If a path to depth is provided, add it to the sample dataframe.
+    if DirType.NORMAL_DEPTH in dirs:
+        depth_paths = np.full(len(samples), np.nan, dtype=object)
+        depth_paths[is_normal] = image_paths[is_dir_type[DirType.NORMAL_DEPTH]]
+        depth_paths[is_abnormal] = image_paths[is_dir_type[DirType.ABNORMAL_DEPTH]]
 
-    samples = DataFrame({"image_path": filenames, "label": labels})
-    samples = samples.sort_values(by="image_path", ignore_index=True)
+        if DirType.NORMAL_TEST in dirs:
+            depth_paths[is_normal_test] = image_paths[is_dir_type[DirType.NORMAL_TEST_DEPTH]]
 
-    # Create label index for normal (0) and abnormal (1) images.
-    samples.loc[
-        (samples.label == DirType.NORMAL) | (samples.label == DirType.NORMAL_TEST),
-        "label_index",
-    ] = LabelName.NORMAL
-    samples.loc[(samples.label == DirType.ABNORMAL), "label_index"] = LabelName.ABNORMAL
-    samples.label_index = samples.label_index.astype("Int64")
+        if __debug__ and os.environ.get(_VALIDATE_FILES_ENV, "0") == "1":
+            # make sure every rgb image has a corresponding depth image and that the file exists
+            image_stems = Series(image_paths[is_abnormal]).astype(str).str.extract(_STEM_PATTERN, expand=False)
+            depth_stems = Series(depth_paths[is_abnormal]).astype(str).str.extract(_STEM_PATTERN, expand=False)
+            assert all(
+                image_stem in depth_stem for image_stem, depth_stem in zip(image_stems, depth_stems, strict=True)
+            ), "Mismatch between anomalous images and depth images. Make sure the mask files in 'xyz' \
+                folder follow the same naming convention as the anomalous images in the dataset \
+                (e.g. image: '000.png', depth: '000.tiff')."
 
-    # If a path to mask is provided, add it to the sample dataframe.
-    if normal_depth_dir:
-        samples.loc[samples.label == DirType.NORMAL, "depth_path"] = samples.loc[
-            samples.label == DirType.NORMAL_DEPTH
-        ].image_path.to_numpy()
-        samples.loc[samples.label == DirType.ABNORMAL, "depth_path"] = samples.loc[
-            samples.label == DirType.ABNORMAL_DEPTH
-        ].image_path.to_numpy()
-
-        if normal_test_dir:
-            samples.loc[samples.label == DirType.NORMAL_TEST, "depth_path"] = samples.loc[
-                samples.label == DirType.NORMAL_TEST_DEPTH
-            ].image_path.to_numpy()
-
-        # make sure every rgb image has a corresponding depth image and that the file exists
-        assert (
-            samples.loc[samples.label_index == LabelName.ABNORMAL]
-            .apply(lambda x: Path(x.image_path).stem in Path(x.depth_path).stem, axis=1)
-            .all()
-        ), "Mismatch between anomalous images and depth images. Make sure the mask files in 'xyz' \
-            folder follow the same naming convention as the anomalous images in the dataset \
-            (e.g. image: '000.png', depth: '000.tiff')."
-
-        assert samples.depth_path.apply(
-            lambda x: Path(x).exists() if not isna(x) else True,
-        ).all(), "missing depth image files"
+            assert all(map(os.path.exists, depth_paths[notna(depth_paths)])), "missing depth image files"
 
-        samples = samples.astype({"depth_path": "str"})
+        columns["depth_path"] = depth_paths
 
     # If a path to mask is provided, add it to the sample dataframe.
-    if mask_dir and abnormal_dir:
-        samples.loc[samples.label == DirType.ABNORMAL, "mask_path"] = samples.loc[
-            samples.label == DirType.MASK
-        ].image_path.to_numpy()
-        samples["mask_path"] = samples["mask_path"].fillna("")
-        samples = samples.astype({"mask_path": "str"})
+    mask_paths = np.full(len(samples), "", dtype=object)
+    if DirType.MASK in dirs and DirType.ABNORMAL in dirs:
+        mask_paths[is_abnormal] = image_paths[is_dir_type[DirType.MASK]]
 
         # make sure all the files exist
-        assert samples.mask_path.apply(
-            lambda x: Path(x).exists() if x != "" else True,
-        ).all(), f"missing mask files, mask_dir={mask_dir}"
-    else:
-        samples["mask_path"] = ""
+        assert all(map(os.path.exists, mask_paths[is_abnormal])), f"missing mask files, mask_dir={dirs[DirType.MASK]}"
+    columns["mask_path"] = mask_paths
+
+    # Create train/test split.
+    # By default, all the normal samples are assigned as train.
+    #   and all the abnormal samples are test.
+    split_codes = np.where(is_normal, _SPLIT_CODES[Split.TRAIN], _SPLIT_CODES[Split.TEST]).astype(np.int8)
 
     # remove all the rows with temporal image samples that have already been assigned
-    samples = samples.loc[
-        (samples.label == DirType.NORMAL) | (samples.label == DirType.ABNORMAL) | (samples.label == DirType.NORMAL_TEST)
-    ]
+    rows = np.flatnonzero(is_normal | is_abnormal | is_normal_test)
+
+    # the label and split columns are returned as enums, they are only decoded for the remaining rows.
+    samples = samples.iloc[rows].assign(
+        label=_DIRTYPES[label_codes[rows]],
+        label_index=pd.array(label_index[rows], dtype="Int64"),
+        **{name: column[rows] for name, column in columns.items()},
+        split=_SPLITS[split_codes[rows]],
+    )
 
     # Ensure the pathlib objects are converted to str.
     # This is because torch dataloader doesn't like pathlib.
-    samples = samples.astype({"image_path": "str"})
+    samples = samples.astype({"image_path": "str", "mask_path": "str"})
+    if DirType.NORMAL_DEPTH in dirs:
+        samples = samples.astype({"depth_path": "str"})
 
-    # Create train/test split.
-    # By default, all the normal samples are assigned as train.
-    #   and all the abnormal samples are test.
-    samples.loc[(samples.label == DirType.NORMAL), "split"] = Split.TRAIN
-    samples.loc[(samples.label == DirType.ABNORMAL) | (samples.label == DirType.NORMAL_TEST), "split"] = Split.TEST
+    return samples
 
-    # Get the data frame for the split.
-    if split:
-        samples = samples[samples.split == split]
-        samples = samples.reset_index(drop=True)
 
-    return samples
+def _filter_split(samples: DataFrame, split: str | Split | None = None) -> DataFrame:
+    """Select the samples of a split.
+
+    Args:
+        samples (DataFrame): Samples of all the splits.
+        split (str | Split | None, optional): Dataset split. All the samples are returned if ``None``.
+            Defaults to ``None``.
+
+    Returns:
+        DataFrame: The samples of the requested split.
+    """
+    if not split:
+        return samples
+    return samples.iloc[np.flatnonzero(samples.split == split)].reset_index(drop=True)
 
 
 class Folder3DDataset(AnomalibDepthDataset):
@@ -319,6 +393,14 @@ class Folder3D(AnomalibDataModule):
             Defaults to ``0.5``.
         seed (int | None, optional): Seed used during random subset splitting.
             Defaults to ``None``.
+        pin_memory (bool): Copy batches into page-locked memory before they are moved to a CUDA device.
+            Defaults to ``True``.
+        persistent_workers (bool): Keep the dataloader worker processes alive between epochs.
+            Defaults to ``True``.
+        prefetch_factor (int | None): Number of batches loaded in advance by each worker.
+            Defaults to ``2``.
+        channels_last (bool): Return the batched images in ``torch.channels_last`` memory format.
+            Defaults to ``False``.
     """
 
     def __init__(
@@ -346,6 +428,10 @@ class Folder3D(AnomalibDataModule):
         val_split_mode: ValSplitMode | str = ValSplitMode.FROM_TEST,
         val_split_ratio: float = 0.5,
         seed: int | None = None,
+        pin_memory: bool = True,
+        persistent_workers: bool = True,
+        prefetch_factor: int | None = 2,
+        channels_last: bool = False,
     ) -> None:
         super().__init__(
             train_batch_size=train_batch_size,
@@ -356,6 +442,10 @@ class Folder3D(AnomalibDataModule):
             val_split_mode=val_split_mode,
             val_split_ratio=val_split_ratio,
             seed=seed,
+            pin_memory=pin_memory,
+            persistent_workers=persistent_workers,
+            prefetch_factor=prefetch_factor,
+            channels_last=channels_last,
         )
         task = TaskType(task)
 
@@ -365,12 +455,16 @@ class Folder3D(AnomalibDataModule):
             center_crop=center_crop,
             normalization=InputNormalizationMethod(normalization),
         )
-        transform_eval = get_transforms(
-            config=transform_config_eval,
-            image_size=image_size,
-            center_crop=center_crop,
-            normalization=InputNormalizationMethod(normalization),
-        )
+        # without custom configs, both pipelines are the same deterministic resize/crop/normalize ops.
+        if transform_config_train is None and transform_config_eval is None:
+            transform_eval = transform_train
+        else:
+            transform_eval = get_transforms(
+                config=transform_config_eval,
+                image_size=image_size,
+                center_crop=center_crop,
+                normalization=InputNormalizationMethod(normalization),
+            )
 
         self.train_data = Folder3DDataset(
             task=task,
@@ -401,3 +495,25 @@ class Folder3D(AnomalibDataModule):
             mask_dir=mask_dir,
             extensions=extensions,
         )
+
+    def _setup(self, _stage: str | None = None) -> None:
+        """Set up the datasets and perform dynamic subset splitting.
+
+        The train and test datasets are built from the same directories, so these are scanned once and the samples
+        are shared between both datasets.
+        """
+        samples = make_folder3d_dataset(
+            root=self.train_data.root,
+            normal_dir=self.train_data.normal_dir,
+            abnormal_dir=self.train_data.abnormal_dir,
+            normal_test_dir=self.train_data.normal_test_dir,
+            mask_dir=self.train_data.mask_dir,
+            normal_depth_dir=self.train_data.normal_depth_dir,
+            abnormal_depth_dir=self.train_data.abnormal_depth_dir,
+            normal_test_depth_dir=self.train_data.normal_test_depth_dir,
+            extensions=self.train_data.extensions,
+        )
+        self.train_data.samples = _filter_split(samples, self.train_data.split)
+        self.test_data.samples = _filter_split(samples, self.test_data.split)
+
+        super()._setup(_stage)
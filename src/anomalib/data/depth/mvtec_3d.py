@@ -239,6 +239,14 @@ class MVTec3D(AnomalibDataModule):
             Defaults to ``0.5``.
         seed (int | None, optional): Seed which may be set to a fixed value for reproducibility.
             Defaults to ``None``.
+        pin_memory (bool): Copy batches into page-locked memory before they are moved to a CUDA device.
+            Defaults to ``True``.
+        persistent_workers (bool): Keep the dataloader worker processes alive between epochs.
+            Defaults to ``True``.
+        prefetch_factor (int | None): Number of batches loaded in advance by each worker.
+            Defaults to ``2``.
+        channels_last (bool): Return the batched images in ``torch.channels_last`` memory format.
+            Defaults to ``False``.
     """
 
     def __init__(
@@ -259,6 +267,10 @@ class MVTec3D(AnomalibDataModule):
         val_split_mode: ValSplitMode | str = ValSplitMode.SAME_AS_TEST,
         val_split_ratio: float = 0.5,
         seed: int | None = None,
+        pin_memory: bool = True,
+        persistent_workers: bool = True,
+        prefetch_factor: int | None = 2,
+        channels_last: bool = False,
     ) -> None:
         super().__init__(
             train_batch_size=train_batch_size,
@@ -269,6 +281,10 @@ class MVTec3D(AnomalibDataModule):
             val_split_mode=val_split_mode,
             val_split_ratio=val_split_ratio,
             seed=seed,
+            pin_memory=pin_memory,
+            persistent_workers=persistent_workers,
+            prefetch_factor=prefetch_factor,
+            channels_last=channels_last,
         )
 
         self.root = Path(root)
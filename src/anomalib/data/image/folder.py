@@ -316,6 +316,14 @@ class Folder(AnomalibDataModule):
             Defaults to ``0.5``.
         seed (int | None, optional): Seed used during random subset splitting.
             Defaults to ``None``.
+        pin_memory (bool): Copy batches into page-locked memory before they are moved to a CUDA device.
+            Defaults to ``True``.
+        persistent_workers (bool): Keep the dataloader worker processes alive between epochs.
+            Defaults to ``True``.
+        prefetch_factor (int | None): Number of batches loaded in advance by each worker.
+            Defaults to ``2``.
+        channels_last (bool): Return the batched images in ``torch.channels_last`` memory format.
+            Defaults to ``False``.
 
     Examples:
         The following code demonstrates how to use the ``Folder`` datamodule. Assume that the dataset is structured
@@ -396,6 +404,10 @@ class Folder(AnomalibDataModule):
         val_split_mode: ValSplitMode | str = ValSplitMode.FROM_TEST,
         val_split_ratio: float = 0.5,
         seed: int | None = None,
+        pin_memory: bool = True,
+        persistent_workers: bool = True,
+        prefetch_factor: int | None = 2,
+        channels_last: bool = False,
     ) -> None:
         task = TaskType(task)
         test_split_mode = TestSplitMode(test_split_mode)
@@ -409,6 +421,10 @@ class Folder(AnomalibDataModule):
             val_split_mode=val_split_mode,
             val_split_ratio=val_split_ratio,
             seed=seed,
+            pin_memory=pin_memory,
+            persistent_workers=persistent_workers,
+            prefetch_factor=prefetch_factor,
+            channels_last=channels_last,
         )
 
         if task == TaskType.SEGMENTATION and test_split_mode == TestSplitMode.FROM_DIR and mask_dir is None:
@@ -23,7 +23,16 @@ from .path import (
     validate_and_resolve_path,
     validate_path,
 )
-from .split import Split, TestSplitMode, ValSplitMode, concatenate_datasets, random_split, split_by_label
+from .split import (
+    Split,
+    TestSplitMode,
+    ValSplitMode,
+    concatenate_datasets,
+    get_subset_lengths,
+    random_split,
+    random_split_by_lengths,
+    split_by_label,
+)
 from .transforms import InputNormalizationMethod, get_transforms
 
 __all__ = [
@@ -33,7 +42,9 @@ __all__ = [
     "random_2d_perlin",
     "read_image",
     "read_depth_image",
+    "get_subset_lengths",
     "random_split",
+    "random_split_by_lengths",
     "split_by_label",
     "concatenate_datasets",
     "Split",
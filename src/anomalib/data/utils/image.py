@@ -346,7 +346,8 @@ def read_image(path: str | Path, image_size: int | tuple[int, int] | None = None
     """
     path = path if isinstance(path, str) else str(path)
     image = cv2.imread(path)
-    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    # swap the channels in-place to avoid allocating a second buffer for the decoded image.
+    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
 
     if image_size:
         # This part is optional, where the user wants to quickly resize the image
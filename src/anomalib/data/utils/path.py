@@ -38,6 +38,37 @@ def _check_and_convert_path(path: str | Path) -> Path:
     return path
 
 
+def _scan_files(path: Path, extensions: frozenset[str]) -> list[str]:
+    """Recursively collect the files with the given extensions under a directory.
+
+    Hidden files and directories (i.e. starting with a dot) are skipped, and symbolic links to directories are not
+    followed. ``os.scandir`` is used rather than ``Path.glob``, since it reuses the file type information returned
+    when listing the directory and does not create a ``Path`` object per entry.
+
+    Args:
+        path (Path): Path to the directory to scan.
+        extensions (frozenset[str]): File extensions to collect, including the leading dot.
+
+    Returns:
+        list[str]: Paths of the matching files.
+    """
+    if any(part.startswith(".") for part in path.parts):
+        return []
+
+    filenames: list[str] = []
+    directories = [str(path)]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif os.path.splitext(entry.name)[1] in extensions and not entry.is_dir():  # noqa: PTH122
+                    filenames.append(entry.path)
+    return filenames
+
+
 def _prepare_files_labels(
     path: str | Path,
     path_type: str,
@@ -52,7 +83,8 @@ def _prepare_files_labels(
             directory.
 
     Returns:
-        List, List: Filenames of the images provided in the paths, labels of the images provided in the paths
+        List, List: Filenames (as ``str``) of the images provided in the paths, labels of the images provided in the
+            paths
     """
     path = _check_and_convert_path(path)
     if extensions is None:
@@ -65,11 +97,7 @@ def _prepare_files_labels(
         msg = f"All extensions {extensions} must start with the dot"
         raise RuntimeError(msg)
 
-    filenames = [
-        f
-        for f in path.glob("**/*")
-        if f.suffix in extensions and not f.is_dir() and not any(part.startswith(".") for part in f.parts)
-    ]
+    filenames = _scan_files(path, frozenset(extensions))
     if not filenames:
         msg = f"Found 0 {path_type} images in {path} with extensions {extensions}"
         raise RuntimeError(msg)
@@ -99,27 +99,10 @@ def random_split(
         per_label_datasets = [dataset]
 
     # outer list: per-label unique, inner list: random subsets with the given ratio
-    subsets: list[list["data.AnomalibDataset"]] = []
-    # split each (label-aware) subset of source data
-    for label_dataset in per_label_datasets:
-        # get subset lengths
-        subset_lengths = [math.floor(len(label_dataset.samples) * ratio) for ratio in split_ratio]
-        for i in range(len(label_dataset.samples) - sum(subset_lengths)):
-            subset_idx = i % sum(subset_lengths)
-            subset_lengths[subset_idx] += 1
-        if 0 in subset_lengths:
-            msg = (
-                "Zero subset length encountered during splitting. This means one of your subsets might be"
-                " empty or devoid of either normal or anomalous images.",
-            )
-            logger.warning(msg)
-
-        # perform random subsampling
-        random_state = torch.Generator().manual_seed(seed) if seed else None
-        indices = torch.randperm(len(label_dataset.samples), generator=random_state)
-        subsets.append(
-            [label_dataset.subsample(subset_indices) for subset_indices in torch.split(indices, subset_lengths)],
-        )
+    subsets = [
+        random_split_by_lengths(label_dataset, get_subset_lengths(len(label_dataset.samples), split_ratio), seed)
+        for label_dataset in per_label_datasets
+    ]
 
     # invert outer/inner lists
     # outer list: subsets with the given ratio, inner list: per-label unique
@@ -127,6 +110,52 @@ def random_split(
     return [concatenate_datasets(subset) for subset in subsets]
 
 
+def get_subset_lengths(num_samples: int, split_ratio: Sequence[float]) -> list[int]:
+    """Compute the lengths of the subsets produced by ``random_split``.
+
+    The lengths are rounded down, and the remaining samples are then distributed over the subsets in a round-robin
+    fashion, starting from the first subset.
+
+    Args:
+        num_samples (int): Number of samples of the source dataset.
+        split_ratio (Sequence[float]): Fractions of the splits that will be produced.
+
+    Returns:
+        list[int]: Number of samples of each subset.
+    """
+    subset_lengths = [math.floor(num_samples * ratio) for ratio in split_ratio]
+    for i in range(num_samples - sum(subset_lengths)):
+        subset_idx = i % sum(subset_lengths)
+        subset_lengths[subset_idx] += 1
+    return subset_lengths
+
+
+def random_split_by_lengths(
+    dataset: "data.AnomalibDataset",
+    subset_lengths: Sequence[int],
+    seed: int | None = None,
+) -> list["data.AnomalibDataset"]:
+    """Randomly split a dataset into subsets of the given lengths.
+
+    Args:
+        dataset (AnomalibDataset): Source dataset
+        subset_lengths (Sequence[int]): Number of samples of each subset. The lengths must sum to the number of
+            samples of the source dataset.
+        seed (int | None, optional): Seed that can be passed if results need to be reproducible
+    """
+    if 0 in subset_lengths:
+        msg = (
+            "Zero subset length encountered during splitting. This means one of your subsets might be"
+            " empty or devoid of either normal or anomalous images.",
+        )
+        logger.warning(msg)
+
+    # perform random subsampling
+    random_state = torch.Generator().manual_seed(seed) if seed else None
+    indices = torch.randperm(len(dataset.samples), generator=random_state)
+    return [dataset.subsample(subset_indices) for subset_indices in torch.split(indices, list(subset_lengths))]
+
+
 def split_by_label(dataset: "data.AnomalibDataset") -> tuple["data.AnomalibDataset", "data.AnomalibDataset"]:
     """Split the dataset into the normal and anomalous subsets."""
     samples = dataset.samples
@@ -17,6 +17,7 @@ from tempfile import mkdtemp
 import albumentations as A  # noqa: N812
 import cv2
 import pandas as pd
+import torch
 from albumentations.pytorch import ToTensorV2
 from pandas import DataFrame, Series
 
@@ -29,12 +30,39 @@ logger = logging.getLogger(__name__)
 
 ROOT = "./.tmp/synthetic_anomaly"
 
+# transform applied to the source images before the anomalous augmentations
+SOURCE_TRANSFORM = A.Compose([A.ToFloat(), ToTensorV2()])
+
+
+def generate_synthetic_anomaly(image_path: str, im_path: Path, mask_path: Path, augmenter: Augmenter) -> None:
+    """Apply a synthetic anomalous augmentation to an image and write the result to the file system.
+
+    Args:
+        image_path (str): Path to the normal source image.
+        im_path (Path): Path to which the synthetic anomalous image will be written.
+        mask_path (Path): Path to which the ground truth anomaly mask will be written.
+        augmenter (Augmenter): Augmenter used to generate the anomaly.
+    """
+    # read and transform image
+    image = read_image(image_path)
+    image = SOURCE_TRANSFORM(image=image)["image"].unsqueeze(0)
+    # apply anomalous perturbation
+    aug_im, mask = augmenter.augment_batch(image)
+    # write image
+    aug_im = (aug_im.squeeze().permute((1, 2, 0)) * 255).numpy()
+    aug_im = cv2.cvtColor(aug_im, cv2.COLOR_RGB2BGR)
+    cv2.imwrite(str(im_path), aug_im)
+    # write mask
+    mask = (mask.squeeze() * 255).numpy()
+    cv2.imwrite(str(mask_path), mask)
+
 
 def make_synthetic_dataset(
     source_samples: DataFrame,
     image_dir: Path,
     mask_dir: Path,
     anomalous_ratio: float = 0.5,
+    lazy: bool = False,
 ) -> DataFrame:
     """Convert a set of normal samples into a mixed set of normal and synthetic anomalous samples.
 
@@ -46,6 +74,9 @@ def make_synthetic_dataset(
         image_dir (Path): Directory to which the synthetic anomalous image files will be written.
         mask_dir (Path): Directory to which the ground truth anomaly masks will be written.
         anomalous_ratio (float): Fraction of source samples that will be converted into anomalous samples.
+        lazy (bool): When True, the synthetic anomalous images are not generated, and the path of their source image
+            is stored in an additional ``source_path`` column instead.
+            Defaults to ``False``.
     """
     assert 1 not in source_samples.label_index.to_numpy(), "All source images must be normal."
     assert image_dir.is_dir(), f"{image_dir} is not a folder."
@@ -60,10 +91,7 @@ def make_synthetic_dataset(
     anomalous_samples = anomalous_samples.reset_index(drop=True)
 
     # initialize augmenter
-    augmenter = Augmenter("./datasets/dtd", p_anomalous=1.0, beta=(0.01, 0.2))
-
-    # initialize transform for source images
-    transform = A.Compose([A.ToFloat(), ToTensorV2()])
+    augmenter = None if lazy else Augmenter("./datasets/dtd", p_anomalous=1.0, beta=(0.01, 0.2))
 
     def augment(sample: Series) -> Series:
         """Apply synthetic anomalous augmentation to a sample from a dataframe.
@@ -77,22 +105,12 @@ def make_synthetic_dataset(
         Returns:
             Series: DataFrame row with updated information about the augmented image.
         """
-        # read and transform image
-        image = read_image(sample.image_path)
-        image = transform(image=image)["image"].unsqueeze(0)
-        # apply anomalous perturbation
-        aug_im, mask = augmenter.augment_batch(image)
         # target file name with leading zeros
         file_name = f"{str(sample.name).zfill(int(math.log10(n_anomalous)) + 1)}.png"
-        # write image
-        aug_im = (aug_im.squeeze().permute((1, 2, 0)) * 255).numpy()
-        aug_im = cv2.cvtColor(aug_im, cv2.COLOR_RGB2BGR)
         im_path = image_dir / file_name
-        cv2.imwrite(str(im_path), aug_im)
-        # write mask
-        mask = (mask.squeeze() * 255).numpy()
         mask_path = mask_dir / file_name
-        cv2.imwrite(str(mask_path), mask)
+        if augmenter is not None:
+            generate_synthetic_anomaly(sample.image_path, im_path, mask_path, augmenter)
         out = {
             "image_path": str(im_path),
             "label": "abnormal",
@@ -100,9 +118,14 @@ def make_synthetic_dataset(
             "mask_path": str(mask_path),
             "split": Split.VAL,
         }
+        if lazy:
+            out["source_path"] = sample.image_path
         return Series(out)
 
     anomalous_samples = anomalous_samples.apply(augment, axis=1)
+    if lazy and "source_path" not in anomalous_samples.columns:
+        # ``apply`` returns the empty frame unchanged when no samples were selected for augmentation
+        anomalous_samples["source_path"] = anomalous_samples.image_path
 
     return pd.concat([normal_samples, anomalous_samples], ignore_index=True)
 
@@ -114,12 +137,19 @@ class SyntheticAnomalyDataset(AnomalibDataset):
         task (str): Task type, either "classification" or "segmentation".
         transform (A.Compose): Albumentations Compose object describing the transforms that are applied to the inputs.
         source_samples (DataFrame): Normal samples to which the anomalous augmentations will be applied.
+        lazy (bool): When True, each synthetic anomalous image is generated on its first access instead of when the
+            dataset is set up. Defaults to ``False``.
     """
 
-    def __init__(self, task: TaskType, transform: A.Compose, source_samples: DataFrame) -> None:
+    def __init__(self, task: TaskType, transform: A.Compose, source_samples: DataFrame, lazy: bool = False) -> None:
         super().__init__(task, transform)
 
         self.source_samples = source_samples
+        self.lazy = lazy
+
+        # source images of the synthetic anomalous images that have not been generated yet, keyed by their image path
+        self._source_paths: dict[str, str] = {}
+        self._augmenter: Augmenter | None = None
 
         # Files will be written to a temporary directory in the workdir, which is cleaned up after code execution
         root = Path(ROOT)
@@ -137,14 +167,20 @@ class SyntheticAnomalyDataset(AnomalibDataset):
         self.setup()
 
     @classmethod
-    def from_dataset(cls: type["SyntheticAnomalyDataset"], dataset: AnomalibDataset) -> "SyntheticAnomalyDataset":
+    def from_dataset(
+        cls: type["SyntheticAnomalyDataset"],
+        dataset: AnomalibDataset,
+        lazy: bool = True,
+    ) -> "SyntheticAnomalyDataset":
         """Create a synthetic anomaly dataset from an existing dataset of normal images.
 
         Args:
             dataset (AnomalibDataset): Dataset consisting of only normal images that will be converrted to a synthetic
                 anomalous dataset with a 50/50 normal anomalous split.
+            lazy (bool): When True, the synthetic anomalous images are generated on first access.
+                Defaults to ``True``.
         """
-        return cls(task=dataset.task, transform=dataset.transform, source_samples=dataset.samples)
+        return cls(task=dataset.task, transform=dataset.transform, source_samples=dataset.samples, lazy=lazy)
 
     def __copy__(self) -> "SyntheticAnomalyDataset":
         """Return a shallow copy of the dataset object and prevents cleanup when original object is deleted."""
@@ -165,8 +201,38 @@ class SyntheticAnomalyDataset(AnomalibDataset):
 
     def _setup(self) -> None:
         """Create samples dataframe."""
-        logger.info("Generating synthetic anomalous images for validation set")
-        self.samples = make_synthetic_dataset(self.source_samples, self.im_dir, self.mask_dir, 0.5)
+        if not self.lazy:
+            logger.info("Generating synthetic anomalous images for validation set")
+        samples = make_synthetic_dataset(self.source_samples, self.im_dir, self.mask_dir, 0.5, lazy=self.lazy)
+        if self.lazy:
+            anomalous_samples = samples[samples.label_index == 1]
+            self._source_paths = dict(zip(anomalous_samples.image_path, anomalous_samples.source_path, strict=True))
+            samples = samples.drop(columns="source_path")
+        self.samples = samples
+
+    def _image_exists(self, image_path: str) -> bool:
+        """Check if the image file, or the source image of a synthetic image that is not generated yet, exists."""
+        return super()._image_exists(self._source_paths.get(image_path, image_path))
+
+    def __getitem__(self, index: int) -> dict[str, str | torch.Tensor]:
+        """Get dataset item for the index ``index``, generating the synthetic anomalous image on its first access.
+
+        The generated files act as the cache, so that the images are shared between the dataloader workers and epochs.
+
+        Args:
+            index (int): Index to get the item.
+
+        Returns:
+            dict[str, str | torch.Tensor]: Dict containing image path, target path, image tensor, label and mask.
+        """
+        image_path = self._sample_columns["image_path"][index]
+        source_path = self._source_paths.get(image_path)
+        if source_path is not None and not Path(image_path).exists():
+            if self._augmenter is None:
+                self._augmenter = Augmenter("./datasets/dtd", p_anomalous=1.0, beta=(0.01, 0.2))
+            mask_path = Path(self._sample_columns["mask_path"][index])
+            generate_synthetic_anomaly(source_path, Path(image_path), mask_path, self._augmenter)
+        return super().__getitem__(index)
 
     def __del__(self) -> None:
         """Make sure the temporary directory is cleaned up when the dataset object is deleted."""
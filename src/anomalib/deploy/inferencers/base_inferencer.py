@@ -4,21 +4,211 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import copy
+import logging
+import os
+import sys
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import islice
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 import cv2
 import numpy as np
 import torch
 from omegaconf import DictConfig, OmegaConf
-from skimage.morphology import dilation
-from skimage.segmentation import find_boundaries
 
 from anomalib.data.utils import read_image
 from anomalib.utils.normalization.min_max import normalize as normalize_min_max
 from anomalib.utils.post_processing import compute_mask
-from anomalib.utils.visualization import ImageResult
+from anomalib.utils.visualization import BatchImageResult, ImageResult
+
+logger = logging.getLogger("anomalib")
+
+if find_spec("turbojpeg") is not None:
+    from turbojpeg import TJCS_CMYK, TJCS_YCCK, TJPF_RGB, TurboJPEG
+
+# Structuring element of the 4-neighbourhood, used to find the boundaries of the segmentation mask.
+_BOUNDARY_KERNEL = cv2.getStructuringElement(cv2.MORPH_CROSS, (3, 3))
+# Structuring element used to thicken the outlines of the segmentation mask.
+_OUTLINE_KERNEL = np.ones((7, 7), dtype=np.uint8)
+# Colour of the outlines of the segmentation mask.
+_OUTLINE_COLOR = np.array([255, 0, 0], dtype=np.uint8)
+
+# Number of decoded images that are kept in memory by the inferencers that cache their images.
+_IMAGE_CACHE_SIZE = 16
+
+# Number of parsed metadata files that are kept in memory.
+_METADATA_CACHE_SIZE = 8
+
+# Extensions of the images that are decoded with TurboJPEG, when it is installed.
+_JPEG_EXTENSIONS = (".jpg", ".jpeg")
+
+# EXIF tag of the orientation of the image.
+_EXIF_ORIENTATION_TAG = 0x0112
+
+
+@lru_cache(maxsize=1)
+def _get_jpeg_decoder() -> "TurboJPEG | None":
+    """Get the TurboJPEG decoder, which is shared by all the inferencers.
+
+    Returns:
+        TurboJPEG | None: The decoder, or ``None`` if PyTurboJPEG or the libjpeg-turbo library is not installed.
+    """
+    if find_spec("turbojpeg") is None:
+        return None
+    try:
+        return TurboJPEG()
+    except RuntimeError:
+        logger.warning("libjpeg-turbo could not be loaded. JPEG images are decoded with OpenCV.")
+        return None
+
+
+def _exif_orientation(jpeg: bytes) -> int:
+    """Get the EXIF orientation of a JPEG image.
+
+    Args:
+        jpeg (bytes): Encoded JPEG image.
+
+    Returns:
+        int: EXIF orientation of the image, ``1`` if the image is not rotated or flipped, or has no orientation.
+    """
+    # walk the segments of the header, which start with a marker and their length, until the APP1 segment of the EXIF.
+    offset = 2
+    while offset + 4 <= len(jpeg) and jpeg[offset] == 0xFF:
+        marker = jpeg[offset + 1]
+        if marker in (0xD9, 0xDA):  # end of image or start of scan
+            break
+        length = int.from_bytes(jpeg[offset + 2 : offset + 4], "big")
+        if marker == 0xE1 and jpeg[offset + 4 : offset + 10] == b"Exif\0\0":
+            # the EXIF data is a TIFF header followed by the entries of the first image file directory.
+            tiff = jpeg[offset + 10 : offset + 2 + length]
+            byteorder: Literal["little", "big"] = "little" if tiff[:2] == b"II" else "big"
+            directory = int.from_bytes(tiff[4:8], byteorder)
+            num_entries = int.from_bytes(tiff[directory : directory + 2], byteorder)
+            for entry in range(directory + 2, directory + 2 + 12 * num_entries, 12):
+                if int.from_bytes(tiff[entry : entry + 2], byteorder) == _EXIF_ORIENTATION_TAG:
+                    return int.from_bytes(tiff[entry + 8 : entry + 10], byteorder)
+            break
+        offset += 2 + length
+    return 1
+
+
+def _read_image(path: str) -> np.ndarray:
+    """Read an image.
+
+    JPEG images are decoded with TurboJPEG when it is installed. TurboJPEG does not apply the EXIF orientation and does
+    not decode CMYK images to RGB, unlike OpenCV, so these images are decoded with OpenCV. The orientation and the
+    color space of the decoded image therefore do not depend on whether TurboJPEG is installed, while the pixel values
+    may differ by a rounding error between the libjpeg-turbo versions.
+
+    Args:
+        path (str): Path to the image.
+
+    Returns:
+        np.ndarray: Decoded RGB image.
+    """
+    decoder = _get_jpeg_decoder()
+    if decoder is not None and Path(path).suffix.lower() in _JPEG_EXTENSIONS:
+        jpeg = Path(path).read_bytes()
+        if _exif_orientation(jpeg) == 1 and decoder.decode_header(jpeg)[3] not in (TJCS_CMYK, TJCS_YCCK):
+            return decoder.decode(jpeg, pixel_format=TJPF_RGB)
+    return read_image(path)
+
+
+@lru_cache(maxsize=_IMAGE_CACHE_SIZE)
+def _read_image_cached(path: str, mtime_ns: int) -> np.ndarray:  # noqa: ARG001
+    """Read an image, caching the decoded image on its path and modification time.
+
+    Args:
+        path (str): Path to the image.
+        mtime_ns (int): Modification time of the file, so that a modified file is read again.
+
+    Returns:
+        np.ndarray: Decoded image, which is shared between the calls and is therefore read-only.
+    """
+    image = _read_image(path)
+    image.setflags(write=False)
+    return image
+
+
+def _advise_will_need(path: str | Path) -> None:
+    """Ask the kernel to read a file ahead, so that it is in the page cache when it is decoded.
+
+    This is a no-op on the platforms that do not support ``posix_fadvise``, and when the file cannot be opened.
+
+    Args:
+        path (str | Path): Path to the file.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    with suppress(OSError):
+        file_descriptor = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(file_descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(file_descriptor)
+
+
+def _read_ahead(paths: Iterable[str | Path], depth: int) -> Iterator[str | Path]:
+    """Yield the paths, while the next ``depth`` files are read ahead by the kernel.
+
+    Args:
+        paths (Iterable[str | Path]): Paths to the files.
+        depth (int): Number of files that are read ahead.
+
+    Yields:
+        str | Path: The paths, in the same order.
+    """
+    pending: deque[str | Path] = deque()
+    for path in paths:
+        _advise_will_need(path)
+        pending.append(path)
+        if len(pending) > depth:
+            yield pending.popleft()
+    yield from pending
+
+
+def _attach_shared_memory(name: str) -> SharedMemory:
+    """Attach to a shared memory block that is owned by another process.
+
+    Before Python 3.13, attaching registers the block with the resource tracker of this process, which unlinks it when
+    this process exits, even though the block is still used by its owner. The block is therefore unregistered.
+
+    Args:
+        name (str): Name of the shared memory block.
+
+    Returns:
+        SharedMemory: The attached shared memory block, which must be closed but not unlinked.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    shared_memory = SharedMemory(name=name)
+    if os.name == "posix":
+        resource_tracker.unregister(shared_memory._name, "shared_memory")  # type: ignore[attr-defined]  # noqa: SLF001
+    return shared_memory
+
+
+@lru_cache(maxsize=_METADATA_CACHE_SIZE)
+def _load_config_cached(path: str, mtime_ns: int) -> DictConfig:  # noqa: ARG001
+    """Load a metadata file, caching the parsed config on its path and modification time.
+
+    Args:
+        path (str): Path to the metadata file.
+        mtime_ns (int): Modification time of the file, so that a modified file is parsed again.
+
+    Returns:
+        DictConfig: Parsed config, which is shared between the calls and must not be modified.
+    """
+    return cast(DictConfig, OmegaConf.load(path))
 
 
 class Inferencer(ABC):
@@ -27,6 +217,9 @@ class Inferencer(ABC):
     This is used by both Torch and OpenVINO inference.
     """
 
+    # Keep the last decoded images in memory, for the applications that predict the same image files repeatedly.
+    cache_images: bool = False
+
     @abstractmethod
     def load_model(self, path: str | Path) -> Any:  # noqa: ANN401
         """Load Model."""
@@ -44,7 +237,12 @@ class Inferencer(ABC):
 
     @abstractmethod
     def post_process(self, predictions: np.ndarray | torch.Tensor, metadata: dict[str, Any] | None) -> dict[str, Any]:
-        """Post-Process."""
+        """Post-Process.
+
+        The returned arrays are handed over to the ``ImageResult`` without being copied, so they must not share memory
+        with buffers that are reused by the model or the runtime. Views of arrays that are created while
+        post-processing do not need to be copied.
+        """
         raise NotImplementedError
 
     def predict(
@@ -65,20 +263,273 @@ class Inferencer(ABC):
         Returns:
             ImageResult: Prediction results to be visualized.
         """
+        ((image_arr, output),) = self._predict_outputs([image], metadata=metadata)
+        return self._collect_result(image_arr, output)
+
+    def predict_shm(
+        self,
+        shm_name: str,
+        shape: tuple[int, ...],
+        dtype: np.dtype | str = np.uint8,
+        metadata: dict[str, Any] | None = None,
+    ) -> ImageResult:
+        """Perform a prediction for an image that is stored in shared memory.
+
+        This avoids pickling the image when it is sent by another process, e.g. the worker of a web server. The image
+        is pre-processed directly from the shared memory, and only the image of the result is copied, so that the
+        shared memory can be released by its owner after the call.
+
+        Args:
+            shm_name (str): Name of the ``multiprocessing.shared_memory.SharedMemory`` block containing the image.
+            shape (tuple[int, ...]): Shape of the image, e.g. ``(height, width, 3)``.
+            dtype (np.dtype | str): Data type of the image.
+                Defaults to ``np.uint8``.
+            metadata (dict[str, Any] | None): Metadata information such as shape, threshold.
+                Defaults to ``None``.
+
+        Returns:
+            ImageResult: Prediction results to be visualized.
+        """
+        shared_memory = _attach_shared_memory(shm_name)
+        try:
+            result = self.predict(np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf), metadata=metadata)
+            # the result must not keep a view of the buffer, which prevents the shared memory from being closed.
+            result.image = result.image.copy()
+        finally:
+            shared_memory.close()
+        return result
+
+    def predict_batch(
+        self,
+        images: Sequence[str | Path | np.ndarray],
+        metadata: dict[str, Any] | None = None,
+        batch_size: int | None = None,
+        as_batch_result: bool = False,
+    ) -> list[ImageResult] | BatchImageResult:
+        """Perform a prediction for a batch of input images.
+
+        The images are read and pre-processed concurrently, and stacked so that the model is called once per batch.
+        The predictions are then post-processed separately for each image.
+
+        Args:
+            images (Sequence[str | Path | np.ndarray]): Input images whose outputs are to be predicted.
+                Each of them could be either a path to image or numpy array itself.
+            metadata (dict[str, Any] | None): Metadata information such as shape, threshold.
+                Defaults to ``None``.
+            batch_size (int | None): Maximum number of images passed to the model at once. All the images are passed
+                at once if ``None``.
+                Defaults to ``None``.
+            as_batch_result (bool): Collect the predictions into a single ``BatchImageResult`` rather than a list of
+                ``ImageResult``. The heat maps and segmentations of the images are then not generated.
+                Defaults to ``False``.
+
+        Returns:
+            list[ImageResult] | BatchImageResult: Prediction results to be visualized, in the order of the input images.
+        """
+        outputs = self._predict_outputs(images, metadata=metadata, batch_size=batch_size)
+        if not as_batch_result:
+            return [self._collect_result(image_arr, output) for image_arr, output in outputs]
+
+        return BatchImageResult.from_arrays(
+            images=[image_arr for image_arr, _ in outputs],
+            pred_scores=[output["pred_score"] for _, output in outputs],
+            pred_labels=[output["pred_label"] for _, output in outputs],
+            anomaly_maps=[output["anomaly_map"] for _, output in outputs],
+            pred_masks=[output["pred_mask"] for _, output in outputs],
+            pred_boxes=[output["pred_boxes"] for _, output in outputs],
+            box_labels=[output["box_labels"] for _, output in outputs],
+        )
+
+    def _predict_outputs(
+        self,
+        images: Sequence[str | Path | np.ndarray],
+        metadata: dict[str, Any] | None = None,
+        batch_size: int | None = None,
+    ) -> list[tuple[np.ndarray, dict[str, Any]]]:
+        """Read, pre-process, forward and post-process a batch of input images.
+
+        Args:
+            images (Sequence[str | Path | np.ndarray]): Input images whose outputs are to be predicted.
+            metadata (dict[str, Any] | None): Metadata information such as shape, threshold.
+                Defaults to ``None``.
+            batch_size (int | None): Maximum number of images passed to the model at once.
+                Defaults to ``None``.
+
+        Returns:
+            list[tuple[np.ndarray, dict[str, Any]]]: Input image and post-processed predictions of each image.
+        """
         if metadata is None:
             metadata = self.metadata if hasattr(self, "metadata") else {}
-        if isinstance(image, str | Path):
-            image_arr: np.ndarray = read_image(image)
-        else:  # image is already a numpy array. Kept for mypy compatibility.
-            image_arr = image
-        metadata["image_shape"] = image_arr.shape[:2]
+        batch_size = batch_size or max(len(images), 1)
+
+        outputs: list[tuple[np.ndarray, dict[str, Any]]] = []
+        for start in range(0, len(images), batch_size):
+            batch = images[start : start + batch_size]
+            if len(batch) == 1:
+                samples = [self._read_and_pre_process(batch[0])]
+            else:
+                # reading and pre-processing mostly run in OpenCV and torch, which release the GIL.
+                with ThreadPoolExecutor(max_workers=min(len(batch), os.cpu_count() or 1)) as executor:
+                    samples = list(executor.map(self._read_and_pre_process, batch))
+            image_arrs, processed_images = zip(*samples, strict=True)
+
+            predictions = self.forward(self._stack(processed_images))
+
+            for image_arr, image_predictions in zip(
+                image_arrs,
+                self._split_predictions(predictions, len(batch)),
+                strict=True,
+            ):
+                # the metadata is copied rather than updated, so that an inferencer can be shared between threads.
+                image_metadata = {**metadata, "image_shape": image_arr.shape[:2]}
+                outputs.append((image_arr, self.post_process(image_predictions, metadata=image_metadata)))
+
+        return outputs
+
+    def predict_stream(
+        self,
+        images: Iterable[str | Path | np.ndarray],
+        metadata: dict[str, Any] | None = None,
+        num_workers: int = 4,
+        prefetch: int = 8,
+    ) -> Iterator[ImageResult]:
+        """Perform predictions for a stream of input images.
+
+        Reading and pre-processing, the forward-pass and post-processing run as separate stages, so that the model is
+        not idle while the next images are decoded. The pre-processing and post-processing stages run in thread pools,
+        and the forward-pass runs in the calling thread.
+
+        Args:
+            images (Iterable[str | Path | np.ndarray]): Input images whose outputs are to be predicted.
+                Each of them could be either a path to image or numpy array itself.
+            metadata (dict[str, Any] | None): Metadata information such as shape, threshold.
+                Defaults to ``None``.
+            num_workers (int): Number of threads of the pre-processing and post-processing stages.
+                Defaults to ``4``.
+            prefetch (int): Maximum number of images that are pending in each of the stages.
+                Defaults to ``8``.
+
+        Yields:
+            ImageResult: Prediction results to be visualized, in the order of the input images.
+        """
+        if metadata is None:
+            metadata = self.metadata if hasattr(self, "metadata") else {}
+
+        image_iterator = iter(images)
+        pre_process_executor = ThreadPoolExecutor(max_workers=num_workers)
+        post_process_executor = ThreadPoolExecutor(max_workers=num_workers)
+        # the queues hold the futures in the order of the input images, so that the order of the results is preserved.
+        pending_inputs: deque[Future] = deque()
+        pending_outputs: deque[Future] = deque()
+        try:
+            for image in islice(image_iterator, prefetch):
+                pending_inputs.append(pre_process_executor.submit(self._read_and_pre_process, image))
+
+            while pending_inputs:
+                image_arr, processed_image = pending_inputs.popleft().result()
+                for image in islice(image_iterator, 1):
+                    pending_inputs.append(pre_process_executor.submit(self._read_and_pre_process, image))
+
+                predictions = self.forward(processed_image)
+                # each image gets its own metadata, as the post-processing of several images runs concurrently.
+                image_metadata = {**metadata, "image_shape": image_arr.shape[:2]}
+                pending_outputs.append(
+                    post_process_executor.submit(self._post_process_result, image_arr, predictions, image_metadata),
+                )
+
+                while pending_outputs and (pending_outputs[0].done() or len(pending_outputs) >= prefetch):
+                    yield pending_outputs.popleft().result()
+
+            while pending_outputs:
+                yield pending_outputs.popleft().result()
+        finally:
+            pre_process_executor.shutdown(cancel_futures=True)
+            post_process_executor.shutdown(cancel_futures=True)
+
+    def predict_paths(
+        self,
+        paths: Iterable[str | Path],
+        metadata: dict[str, Any] | None = None,
+        num_workers: int = 4,
+        prefetch: int = 8,
+    ) -> Iterator[ImageResult]:
+        """Perform predictions for a stream of image files.
+
+        In addition to the pipelining of ``predict_stream``, the kernel is asked to read the next files ahead, so that
+        reading the files from a cold disk overlaps with the inference.
+
+        Args:
+            paths (Iterable[str | Path]): Paths to the images whose outputs are to be predicted.
+            metadata (dict[str, Any] | None): Metadata information such as shape, threshold.
+                Defaults to ``None``.
+            num_workers (int): Number of threads of the pre-processing and post-processing stages.
+                Defaults to ``4``.
+            prefetch (int): Maximum number of images that are pending in each of the stages, and number of files that
+                are read ahead.
+                Defaults to ``8``.
+
+        Yields:
+            ImageResult: Prediction results to be visualized, in the order of the input paths.
+        """
+        yield from self.predict_stream(
+            _read_ahead(paths, prefetch),
+            metadata=metadata,
+            num_workers=num_workers,
+            prefetch=prefetch,
+        )
+
+    def predict_many(
+        self,
+        images: Iterable[str | Path | np.ndarray],
+        metadata: dict[str, Any] | None = None,
+    ) -> list[ImageResult]:
+        """Perform predictions for several input images.
+
+        The images are predicted with ``predict_stream`` by default. Inferencers may override this method with a more
+        efficient strategy of their runtime.
 
-        processed_image = self.pre_process(image_arr)
-        predictions = self.forward(processed_image)
-        output = self.post_process(predictions, metadata=metadata)
+        Args:
+            images (Iterable[str | Path | np.ndarray]): Input images whose outputs are to be predicted.
+                Each of them could be either a path to image or numpy array itself.
+            metadata (dict[str, Any] | None): Metadata information such as shape, threshold.
+                Defaults to ``None``.
+
+        Returns:
+            list[ImageResult]: Prediction results to be visualized, in the order of the input images.
+        """
+        return list(self.predict_stream(images, metadata=metadata))
+
+    def _post_process_result(
+        self,
+        image: np.ndarray,
+        predictions: Any,  # noqa: ANN401
+        metadata: dict[str, Any] | DictConfig,
+    ) -> ImageResult:
+        """Post-process the predictions of an image and collect them into an ``ImageResult``.
 
+        Args:
+            image (np.ndarray): Input image.
+            predictions (Any): Raw output predicted by the model for the image.
+            metadata (dict[str, Any] | DictConfig): Metadata information such as shape, threshold.
+
+        Returns:
+            ImageResult: Prediction results to be visualized.
+        """
+        return self._collect_result(image, self.post_process(predictions, metadata=metadata))
+
+    @staticmethod
+    def _collect_result(image: np.ndarray, output: dict[str, Any]) -> ImageResult:
+        """Collect the post-processed predictions of an image into an ``ImageResult``.
+
+        Args:
+            image (np.ndarray): Input image.
+            output (dict[str, Any]): Post-processed predictions of the image.
+
+        Returns:
+            ImageResult: Prediction results to be visualized.
+        """
         return ImageResult(
-            image=image_arr,
+            image=image,
             pred_score=output["pred_score"],
             pred_label=output["pred_label"],
             anomaly_map=output["anomaly_map"],
@@ -87,6 +538,65 @@ class Inferencer(ABC):
             box_labels=output["box_labels"],
         )
 
+    def _read_and_pre_process(self, image: str | Path | np.ndarray) -> tuple[np.ndarray, np.ndarray | torch.Tensor]:
+        """Read an image if needed, and pre-process it.
+
+        Args:
+            image (str | Path | np.ndarray): Path to image or numpy array itself.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray | torch.Tensor]: Input image and pre-processed image.
+        """
+        if isinstance(image, str | Path) and self.cache_images:
+            # the cached image is copied, since the result image may be modified in place (e.g. to draw outlines).
+            image_arr: np.ndarray = _read_image_cached(str(image), Path(image).stat().st_mtime_ns).copy()
+        elif isinstance(image, str | Path):
+            image_arr = _read_image(str(image))
+        else:  # image is already a numpy array. Kept for mypy compatibility.
+            image_arr = image
+        return image_arr, self.pre_process(image_arr)
+
+    @staticmethod
+    def _stack(processed_images: Sequence[np.ndarray | torch.Tensor]) -> np.ndarray | torch.Tensor:
+        """Stack pre-processed images, which already have a batch dimension, into a single batch.
+
+        Args:
+            processed_images (Sequence[np.ndarray | torch.Tensor]): Pre-processed images.
+
+        Returns:
+            np.ndarray | torch.Tensor: Batch of pre-processed images.
+        """
+        if len(processed_images) == 1:
+            return processed_images[0]
+        if isinstance(processed_images[0], torch.Tensor):
+            return torch.cat(list(processed_images))
+        return np.concatenate(processed_images)
+
+    def _split_predictions(self, predictions: Any, batch_size: int) -> list[Any]:  # noqa: ANN401
+        """Split the predictions of a batch into the predictions of each image.
+
+        Tensors and arrays are sliced along their first dimension, so that the predictions of each image keep their
+        batch dimension. Mappings and sequences of tensors are split element-wise.
+
+        Args:
+            predictions (Any): Raw output predicted by the model for the whole batch.
+            batch_size (int): Number of images in the batch.
+
+        Returns:
+            list[Any]: Raw predictions of each image.
+        """
+        if batch_size == 1:
+            return [predictions]
+        if isinstance(predictions, Mapping):
+            items = {key: self._split_predictions(value, batch_size) for key, value in predictions.items()}
+            return [{key: value[index] for key, value in items.items()} for index in range(batch_size)]
+        if isinstance(predictions, Sequence) and not isinstance(predictions, str):
+            elements = [self._split_predictions(value, batch_size) for value in predictions]
+            return [type(predictions)(element[index] for element in elements) for index in range(batch_size)]
+        if isinstance(predictions, torch.Tensor | np.ndarray) and predictions.ndim > 0:
+            return [predictions[index : index + 1] for index in range(batch_size)]
+        return [predictions] * batch_size
+
     @staticmethod
     def _superimpose_segmentation_mask(metadata: dict, anomaly_map: np.ndarray, image: np.ndarray) -> np.ndarray:
         """Superimpose segmentation mask on top of image.
@@ -102,10 +612,15 @@ class Inferencer(ABC):
         pred_mask = compute_mask(anomaly_map, 0.5)  # assumes predictions are normalized.
         image_height = metadata["image_shape"][0]
         image_width = metadata["image_shape"][1]
-        pred_mask = cv2.resize(pred_mask, (image_width, image_height))
-        boundaries = find_boundaries(pred_mask)
-        outlines = dilation(boundaries, np.ones((7, 7)))
-        image[outlines] = [255, 0, 0]
+        # the mask is binary, so it is resized with a nearest-neighbour lookup rather than interpolated.
+        pred_mask = cv2.resize(pred_mask, (image_width, image_height), interpolation=cv2.INTER_NEAREST)
+        # the morphological gradient (dilation - erosion) is non-zero for the pixels that have a neighbour with a
+        # different value, on both sides of the boundaries. It is computed by OpenCV in a single call.
+        boundaries = cv2.morphologyEx(pred_mask, cv2.MORPH_GRADIENT, _BOUNDARY_KERNEL)
+        outlines = cv2.dilate(boundaries, _OUTLINE_KERNEL)
+        # the outlines are clipped to 0/1 in place, so that they can be used as a boolean mask without a copy.
+        np.minimum(outlines, 1, out=outlines)
+        np.copyto(image, _OUTLINE_COLOR, where=outlines[..., None].view(bool))
         return image
 
     def __call__(self, image: np.ndarray) -> ImageResult:
@@ -167,6 +682,7 @@ class Inferencer(ABC):
         """
         metadata: dict[str, float | np.ndarray | torch.Tensor] | DictConfig = {}
         if path is not None:
-            config = OmegaConf.load(path)
-            metadata = cast(DictConfig, config)
+            # each inferencer gets its own copy of the cached config, as the metadata may be modified.
+            config = _load_config_cached(str(path), Path(path).stat().st_mtime_ns)
+            metadata = copy.deepcopy(config)
         return metadata
@@ -5,6 +5,7 @@
 
 
 import logging
+from collections.abc import Iterable
 from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -15,6 +16,7 @@ import numpy as np
 from omegaconf import DictConfig
 
 from anomalib import TaskType
+from anomalib.utils.visualization import ImageResult
 
 from .base_inferencer import Inferencer
 
@@ -24,7 +26,7 @@ if find_spec("openvino") is not None:
     import openvino.runtime as ov
 
     if TYPE_CHECKING:
-        from openvino.runtime import CompiledModel
+        from openvino.runtime import CompiledModel, InferRequest
 else:
     logger.warning("OpenVINO is not installed. Please install OpenVINO to use OpenVINOInferencer.")
 
@@ -41,8 +43,13 @@ class OpenVINOInferencer(Inferencer):
             Defaults to ``AUTO``.
         task (TaskType | None, optional): Task type.
             Defaults to ``None``.
-        config (dict | None, optional): Configuration parameters for the inference
+        config (dict | None, optional): Configuration parameters for the inference, e.g.
+            ``{"INFERENCE_PRECISION_HINT": "bf16"}`` to run the inference in reduced precision on supported devices,
+            or ``{"PERFORMANCE_HINT": "THROUGHPUT"}`` to optimize ``predict_many`` for throughput.
             Defaults to ``None``.
+        cache_images (bool): Keep the last decoded images in memory, for the applications that predict the same image
+            files repeatedly. Each prediction then copies the cached image.
+            Defaults to ``False``.
 
     Examples:
         Assume that we have an OpenVINO IR model and metadata files in the following structure:
@@ -93,8 +100,10 @@ class OpenVINOInferencer(Inferencer):
         device: str | None = "AUTO",
         task: str | None = None,
         config: dict | None = None,
+        cache_images: bool = False,
     ) -> None:
         self.device = device
+        self.cache_images = cache_images
 
         self.config = config
         self.input_blob, self.output_blob, self.model = self.load_model(path)
@@ -173,6 +182,71 @@ class OpenVINOInferencer(Inferencer):
         """
         return self.model(image)
 
+    def predict_many(
+        self,
+        images: Iterable[str | Path | np.ndarray],
+        metadata: dict[str, Any] | None = None,
+    ) -> list[ImageResult]:
+        """Perform predictions for several input images with asynchronous inference requests.
+
+        The images are submitted to an ``AsyncInferQueue``, so that several inference requests run in parallel on the
+        device. The number of parallel requests is the optimal number of the compiled model, which depends on its
+        ``PERFORMANCE_HINT``. Submitting an image waits for an idle request, so only this number of images is in flight,
+        and the outputs are post-processed as soon as their request completes.
+
+        Args:
+            images (Iterable[str | Path | np.ndarray]): Input images whose outputs are to be predicted.
+                Each of them could be either a path to image or numpy array itself.
+            metadata (dict[str, Any] | None): Metadata information such as shape, threshold.
+                Defaults to ``None``.
+
+        Returns:
+            list[ImageResult]: Prediction results to be visualized, in the order of the input images.
+        """
+        if metadata is None:
+            metadata = self.metadata
+
+        # each call has its own queue, so that concurrent calls on the inferencer do not replace each other's callback.
+        infer_queue = ov.AsyncInferQueue(self.model)
+        results: dict[int, ImageResult] = {}
+        errors: list[Exception] = []
+
+        def collect(request: "InferRequest", userdata: tuple[int, np.ndarray]) -> None:
+            index, image_arr = userdata
+            try:
+                # the request is reused for the next images, so its output is copied before it is post-processed.
+                predictions = {self.output_blob: request.get_output_tensor(0).data.copy()}
+                image_metadata = {**metadata, "image_shape": image_arr.shape[:2]}
+                results[index] = self._post_process_result(image_arr, predictions, image_metadata)
+            except Exception as error:  # noqa: BLE001
+                # exceptions cannot be propagated from the callback, they are raised once all the requests completed.
+                errors.append(error)
+
+        infer_queue.set_callback(collect)
+        for index, image in enumerate(images):
+            image_arr, processed_image = self._read_and_pre_process(image)
+            infer_queue.start_async({0: processed_image}, userdata=(index, image_arr))
+        infer_queue.wait_all()
+
+        if errors:
+            raise errors[0]
+        return [results[index] for index in range(len(results))]
+
+    def _split_predictions(self, predictions: Any, batch_size: int) -> list[Any]:  # noqa: ANN401
+        """Split the predictions of a batch into the predictions of each image.
+
+        Args:
+            predictions (Any): Raw output of the compiled model for the whole batch.
+            batch_size (int): Number of images in the batch.
+
+        Returns:
+            list[Any]: Raw predictions of each image, indexed by the output blob.
+        """
+        if batch_size == 1:
+            return [predictions]
+        outputs = predictions[self.output_blob]
+        return [{self.output_blob: outputs[index : index + 1]} for index in range(batch_size)]
+
     def post_process(self, predictions: np.ndarray, metadata: dict | DictConfig | None = None) -> dict[str, Any]:
         """Post process the output predictions.
 
@@ -215,7 +289,8 @@ class OpenVINOInferencer(Inferencer):
             _, pred_score = self._normalize(pred_scores=pred_score, metadata=metadata)
         elif task in (TaskType.SEGMENTATION, TaskType.DETECTION):
             if "pixel_threshold" in metadata:
-                pred_mask = (anomaly_map >= metadata["pixel_threshold"]).astype(np.uint8)
+                # the boolean mask is reinterpreted as uint8 without copying it.
+                pred_mask = (anomaly_map >= metadata["pixel_threshold"]).view(np.uint8)
 
             anomaly_map, pred_score = self._normalize(
                 pred_scores=pred_score,
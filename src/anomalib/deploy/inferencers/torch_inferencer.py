@@ -20,6 +20,9 @@ from anomalib.data.utils.boxes import masks_to_boxes
 
 from .base_inferencer import Inferencer
 
+# Data types of the supported reduced precisions.
+PRECISION_DTYPES = {"bf16": torch.bfloat16, "fp16": torch.float16}
+
 
 class TorchInferencer(Inferencer):
     """PyTorch implementation for the inference.
@@ -29,6 +32,16 @@ class TorchInferencer(Inferencer):
         device (str): Device to use for inference. Options are ``auto``,
             ``cpu``, ``cuda``.
             Defaults to ``auto``.
+        precision (str | None): Reduced precision in which the forward-pass is run with autocast. Options are
+            ``bf16``, ``fp16``. ``fp16`` is only supported on CUDA devices. The forward-pass runs in full precision if
+            ``None``.
+            Defaults to ``None``.
+        compile_model (bool): Compile the model with ``torch.compile`` when it is loaded. The first predictions are
+            slower, as they trigger the compilation.
+            Defaults to ``False``.
+        cache_images (bool): Keep the last decoded images in memory, for the applications that predict the same image
+            files repeatedly. Each prediction then copies the cached image.
+            Defaults to ``False``.
 
     Examples:
         Assume that we have a Torch ``pt`` model and metadata files in the
@@ -62,8 +75,22 @@ class TorchInferencer(Inferencer):
         self,
         path: str | Path,
         device: str = "auto",
+        precision: str | None = None,
+        compile_model: bool = False,
+        cache_images: bool = False,
     ) -> None:
         self.device = self._get_device(device)
+        if precision is not None and precision not in PRECISION_DTYPES:
+            msg = f"Unknown precision {precision}. Choose from {list(PRECISION_DTYPES)}."
+            raise ValueError(msg)
+        if precision == "fp16" and self.device.type == "cpu":
+            msg = "Precision fp16 is not supported by autocast on CPU. Use bf16 instead."
+            raise ValueError(msg)
+        self.precision = precision
+        self.compile_model = compile_model
+        self.cache_images = cache_images
+        # the inputs are copied to the GPU on a dedicated stream, so that the copies overlap with the forward-pass.
+        self._copy_stream = torch.cuda.Stream(self.device) if self.device.type == "cuda" else None
 
         # Load the model weights, metadata and data transforms.
         self.checkpoint = self._load_checkpoint(path)
@@ -157,7 +184,10 @@ class TorchInferencer(Inferencer):
 
         model = checkpoint["model"]
         model.eval()
-        return model.to(self.device)
+        model = model.to(self.device)
+        if self.compile_model:
+            model = torch.compile(model, mode="max-autotune")
+        return model
 
     def pre_process(self, image: np.ndarray) -> torch.Tensor:
         """Pre process the input image by applying transformations.
@@ -173,7 +203,12 @@ class TorchInferencer(Inferencer):
         if len(processed_image) == 3:
             processed_image = processed_image.unsqueeze(0)
 
-        return processed_image.to(self.device)
+        if self._copy_stream is None:
+            return processed_image.to(self.device)
+
+        # copying from pinned memory is asynchronous, the image is used once the current stream waited for the copy.
+        with torch.cuda.stream(self._copy_stream):
+            return processed_image.pin_memory().to(self.device, non_blocking=True)
 
     def forward(self, image: torch.Tensor) -> torch.Tensor:
         """Forward-Pass input tensor to the model.
@@ -184,7 +219,79 @@ class TorchInferencer(Inferencer):
         Returns:
             Tensor: Output predictions.
         """
-        return self.model(image)
+        self._wait_for_copies([image])
+
+        if self.precision is None:
+            return self.model(image)
+
+        with torch.autocast(device_type=self.device.type, dtype=PRECISION_DTYPES[self.precision]):
+            predictions = self.model(image)
+        # the post-processing converts the predictions to numpy, which does not support bfloat16.
+        return self._to_float(predictions)
+
+    def _wait_for_copies(self, images: Sequence[torch.Tensor]) -> None:
+        """Make the current stream wait for the copies of pre-processed images to the device.
+
+        Args:
+            images (Sequence[torch.Tensor]): Pre-processed images, which are used on the current stream.
+        """
+        if self._copy_stream is None:
+            return
+        compute_stream = torch.cuda.current_stream(self.device)
+        compute_stream.wait_stream(self._copy_stream)
+        for image in images:
+            if image.is_cuda:
+                # the image was allocated on the copy stream, its memory must not be reused before the current stream
+                # is done with it.
+                image.record_stream(compute_stream)
+
+    def _stack(self, processed_images: Sequence[torch.Tensor]) -> torch.Tensor:
+        """Stack pre-processed images into a single batch, once they are copied to the device.
+
+        Args:
+            processed_images (Sequence[torch.Tensor]): Pre-processed images.
+
+        Returns:
+            torch.Tensor: Batch of pre-processed images.
+        """
+        # the concatenation reads the images, so it must wait for their copies rather than the forward-pass.
+        self._wait_for_copies(processed_images)
+        return super()._stack(processed_images)
+
+    @classmethod
+    def _to_float(
+        cls: type["TorchInferencer"],
+        predictions: torch.Tensor | list[torch.Tensor] | dict[str, torch.Tensor],
+    ) -> torch.Tensor | list[torch.Tensor] | dict[str, torch.Tensor]:
+        """Convert the floating point tensors of the predictions to full precision.
+
+        Args:
+            predictions (Tensor | list[torch.Tensor] | dict[str, torch.Tensor]): Raw output predicted by the model.
+
+        Returns:
+            Tensor | list[torch.Tensor] | dict[str, torch.Tensor]: Predictions in full precision.
+        """
+        if isinstance(predictions, torch.Tensor):
+            return predictions.float() if predictions.is_floating_point() else predictions
+        if isinstance(predictions, dict):
+            return {key: cls._to_float(value) for key, value in predictions.items()}
+        if isinstance(predictions, list | tuple):
+            return type(predictions)(cls._to_float(value) for value in predictions)
+        return predictions
+
+    @staticmethod
+    def _to_numpy(array: torch.Tensor | np.ndarray) -> np.ndarray:
+        """Convert a tensor to a numpy array, copying it from the device if needed.
+
+        Args:
+            array (torch.Tensor | np.ndarray): Tensor or array.
+
+        Returns:
+            np.ndarray: Numpy array.
+        """
+        if isinstance(array, torch.Tensor):
+            return array.detach().cpu().numpy()
+        return array
 
     def post_process(
         self,
@@ -208,22 +315,23 @@ class TorchInferencer(Inferencer):
         # Some models return a Tensor while others return a list or dictionary. Handle both cases.
         # TODO(ashwinvaidya17): Wrap this post-processing stage within the model's forward pass.
         # CVS-122674
+        # The predictions stay on the device during the post-processing, and are only converted to numpy at the end.
 
         # Case I: Predictions could be a tensor.
         if isinstance(predictions, torch.Tensor):
-            anomaly_map = predictions.detach().cpu().numpy()
+            anomaly_map = predictions.detach()
             pred_score = anomaly_map.reshape(-1).max()
 
         # Case II: Predictions could be a dictionary of tensors.
         elif isinstance(predictions, dict):
             if "anomaly_map" in predictions:
-                anomaly_map = predictions["anomaly_map"].detach().cpu().numpy()
+                anomaly_map = predictions["anomaly_map"].detach()
             else:
                 msg = "``anomaly_map`` not found in the predictions."
                 raise KeyError(msg)
 
             if "pred_score" in predictions:
-                pred_score = predictions["pred_score"].detach().cpu().numpy()
+                pred_score = predictions["pred_score"].detach()
             else:
                 pred_score = anomaly_map.reshape(-1).max()
 
@@ -231,8 +339,8 @@ class TorchInferencer(Inferencer):
         elif isinstance(predictions, Sequence):
             if isinstance(predictions[1], (torch.Tensor)):
                 anomaly_map, pred_score = predictions
-                anomaly_map = anomaly_map.detach().cpu().numpy()
-                pred_score = pred_score.detach().cpu().numpy()
+                anomaly_map = anomaly_map.detach()
+                pred_score = pred_score.detach()
             else:
                 anomaly_map, pred_score = predictions
                 pred_score = pred_score.detach()
@@ -253,13 +361,13 @@ class TorchInferencer(Inferencer):
 
         pred_mask: np.ndarray | None = None
         if "pixel_threshold" in metadata:
-            pred_mask = (anomaly_map >= metadata["pixel_threshold"]).squeeze().astype(np.uint8)
+            # the boolean mask is reinterpreted as uint8 without copying it.
+            pred_mask = self._to_numpy((anomaly_map >= metadata["pixel_threshold"]).squeeze()).view(np.uint8)
 
         anomaly_map = anomaly_map.squeeze()
         anomaly_map, pred_score = self._normalize(anomaly_maps=anomaly_map, pred_scores=pred_score, metadata=metadata)
 
-        if isinstance(anomaly_map, torch.Tensor):
-            anomaly_map = anomaly_map.detach().cpu().numpy()
+        anomaly_map = self._to_numpy(anomaly_map)
 
         if "image_shape" in metadata and anomaly_map.shape != metadata["image_shape"]:
             image_height = metadata["image_shape"][0]
@@ -5,6 +5,7 @@
 
 
 import math
+from functools import lru_cache
 
 import cv2
 import numpy as np
@@ -121,6 +122,19 @@ def superimpose_anomaly_map(
     return cv2.addWeighted(anomaly_map, alpha, image, (1 - alpha), gamma)
 
 
+@lru_cache(maxsize=16)
+def _threshold_lut(threshold: float) -> np.ndarray:
+    """Get the lookup table that thresholds uint8 values.
+
+    Args:
+        threshold (float): Threshold above which the values are mapped to 1.
+
+    Returns:
+        np.ndarray: Lookup table of the 256 uint8 values, which is shared between the calls and must not be modified.
+    """
+    return (np.arange(256) > threshold).astype(np.uint8)
+
+
 def compute_mask(anomaly_map: np.ndarray, threshold: float, kernel_size: int = 4) -> np.ndarray:
     """Compute anomaly mask via thresholding the predicted anomaly map.
 
@@ -133,8 +147,13 @@ def compute_mask(anomaly_map: np.ndarray, threshold: float, kernel_size: int = 4
         Predicted anomaly mask
     """
     anomaly_map = anomaly_map.squeeze()
-    mask: np.ndarray = np.zeros_like(anomaly_map).astype(np.uint8)
-    mask[anomaly_map > threshold] = 1
+    mask: np.ndarray
+    if anomaly_map.dtype == np.uint8:
+        # a uint8 anomaly map only has 256 possible values, so it is thresholded with a lookup table in a single pass.
+        mask = cv2.LUT(anomaly_map, _threshold_lut(threshold))
+    else:
+        mask = np.zeros_like(anomaly_map).astype(np.uint8)
+        mask[anomaly_map > threshold] = 1
 
     kernel = morphology.disk(kernel_size)
     mask = morphology.opening(mask, kernel)
@@ -4,11 +4,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from .base import BaseVisualizer, GeneratorResult, VisualizationStep
-from .image import ImageResult, ImageVisualizer
+from .image import BatchImageResult, ImageResult, ImageVisualizer
 from .metrics import MetricsVisualizer
 
 __all__ = [
     "BaseVisualizer",
+    "BatchImageResult",
     "ImageResult",
     "ImageVisualizer",
     "GeneratorResult",
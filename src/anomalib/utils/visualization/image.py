@@ -3,10 +3,11 @@
 # Copyright (C) 2022-2024 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import cast
 
 import cv2
 import matplotlib.figure
@@ -33,9 +34,13 @@ class VisualizationMode(str, Enum):
     SIMPLE = "simple"
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageResult:
-    """Collection of data needed to visualize the predictions for an image."""
+    """Collection of data needed to visualize the predictions for an image.
+
+    The fields are stored in slots rather than in an instance dictionary, as a result is created for every predicted
+    image.
+    """
 
     image: np.ndarray
     pred_score: float
@@ -69,6 +74,114 @@ class ImageResult:
             self.anomalous_boxes = self.pred_boxes[self.box_labels.astype(bool)]
 
 
+@dataclass(slots=True)
+class BatchImageResult:
+    """Collection of the predictions for a batch of images, with one array per field.
+
+    Unlike a list of ``ImageResult``, the scores, labels, anomaly maps and masks of all the images are each stored in a
+    single contiguous array, which is cheaper to process one field at a time. The anomaly maps and masks of images of
+    different sizes cannot be stacked, and are stored as lists of arrays instead.
+    """
+
+    images: list[np.ndarray]
+    pred_scores: np.ndarray
+    pred_labels: np.ndarray
+    anomaly_maps: np.ndarray | list[np.ndarray] | None = None
+    pred_masks: np.ndarray | list[np.ndarray] | None = None
+    pred_boxes: list[np.ndarray] | None = None
+    box_labels: list[np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        """Get the number of images in the batch."""
+        return len(self.images)
+
+    @classmethod
+    def from_arrays(
+        cls: type["BatchImageResult"],
+        images: Sequence[np.ndarray],
+        pred_scores: Sequence[float],
+        pred_labels: Sequence[str | None],
+        anomaly_maps: Sequence[np.ndarray | None] | None = None,
+        pred_masks: Sequence[np.ndarray | None] | None = None,
+        pred_boxes: Sequence[np.ndarray | None] | None = None,
+        box_labels: Sequence[np.ndarray | None] | None = None,
+    ) -> "BatchImageResult":
+        """Collect the predictions of several images into a batch result.
+
+        As in ``ImageResult``, binary masks are scaled to ``[0, 255]``.
+
+        Args:
+            images (Sequence[np.ndarray]): Input images.
+            pred_scores (Sequence[float]): Predicted anomaly scores.
+            pred_labels (Sequence[str | None]): Predicted labels.
+            anomaly_maps (Sequence[np.ndarray | None] | None): Predicted anomaly maps.
+                Defaults to ``None``.
+            pred_masks (Sequence[np.ndarray | None] | None): Predicted masks.
+                Defaults to ``None``.
+            pred_boxes (Sequence[np.ndarray | None] | None): Predicted bounding boxes.
+                Defaults to ``None``.
+            box_labels (Sequence[np.ndarray | None] | None): Labels of the predicted bounding boxes.
+                Defaults to ``None``.
+
+        Returns:
+            BatchImageResult: Prediction results of the batch.
+        """
+        masks = _stack([] if pred_masks is None else pred_masks)
+        if isinstance(masks, np.ndarray) and masks.max(initial=0) <= 1:
+            masks *= 255
+        elif isinstance(masks, list):
+            for mask in masks:
+                if mask.max(initial=0) <= 1:
+                    np.multiply(mask, 255, out=mask)
+
+        return cls(
+            images=list(images),
+            pred_scores=np.array(pred_scores),
+            pred_labels=np.array(pred_labels),
+            anomaly_maps=_stack([] if anomaly_maps is None else anomaly_maps),
+            pred_masks=masks,
+            pred_boxes=_collect([] if pred_boxes is None else pred_boxes),
+            box_labels=_collect([] if box_labels is None else box_labels),
+        )
+
+    @classmethod
+    def from_results(cls: type["BatchImageResult"], results: Sequence[ImageResult]) -> "BatchImageResult":
+        """Collect the results of several images into a batch result.
+
+        Args:
+            results (Sequence[ImageResult]): Prediction results of the images.
+
+        Returns:
+            BatchImageResult: Prediction results of the batch.
+        """
+        return cls.from_arrays(
+            images=[result.image for result in results],
+            pred_scores=[result.pred_score for result in results],
+            pred_labels=[result.pred_label for result in results],
+            anomaly_maps=[result.anomaly_map for result in results],
+            pred_masks=[result.pred_mask for result in results],
+            pred_boxes=[result.pred_boxes for result in results],
+            box_labels=[result.box_labels for result in results],
+        )
+
+
+def _collect(arrays: Sequence[np.ndarray | None]) -> list[np.ndarray] | None:
+    """Collect the arrays of a field into a list, or ``None`` if the field is missing for any of the images."""
+    if not arrays or any(array is None for array in arrays):
+        return None
+    return cast(list[np.ndarray], list(arrays))
+
+
+def _stack(arrays: Sequence[np.ndarray | None]) -> np.ndarray | list[np.ndarray] | None:
+    """Stack the arrays of a field, or collect them into a list if they have different shapes or data types."""
+    collected = _collect(arrays)
+    if collected is None:
+        return None
+    if any(array.shape != collected[0].shape or array.dtype != collected[0].dtype for array in collected):
+        return collected
+    return np.stack(collected)
+
+
 class ImageVisualizer(BaseVisualizer):
     """Image/video generator."""
 
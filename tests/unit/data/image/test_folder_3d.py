@@ -3,7 +3,9 @@
 # Copyright (C) 2023-2024 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import shutil
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 import pytest
 
@@ -15,11 +17,11 @@ from tests.unit.data.base import _TestAnomalibDepthDatamodule
 class TestFolder3D(_TestAnomalibDepthDatamodule):
     """Folder3D Datamodule Unit Tests."""
 
-    @pytest.fixture()
-    def datamodule(self, dataset_path: Path, task_type: TaskType) -> Folder3D:
-        """Create and return a Folder 3D datamodule."""
-        _datamodule = Folder3D(
-            root=dataset_path / "mvtec_3d/dummy",
+    @staticmethod
+    def _create_datamodule(root: Path, task_type: TaskType, **kwargs) -> Folder3D:
+        """Create a Folder 3D datamodule from the directory structure of the dummy MVTec 3D dataset."""
+        return Folder3D(
+            root=root,
             normal_dir="train/good/rgb",
             abnormal_dir="test/bad/rgb",
             normal_test_dir="test/good/rgb",
@@ -32,8 +34,43 @@ class TestFolder3D(_TestAnomalibDepthDatamodule):
             eval_batch_size=4,
             num_workers=0,
             task=task_type,
+            **kwargs,
         )
+
+    @pytest.fixture()
+    def datamodule(self, dataset_path: Path, task_type: TaskType) -> Folder3D:
+        """Create and return a Folder 3D datamodule."""
+        _datamodule = self._create_datamodule(dataset_path / "mvtec_3d/dummy", task_type)
         _datamodule.prepare_data()
         _datamodule.setup()
 
         return _datamodule
+
+    def test_samples_are_not_cached(self, dataset_path: Path) -> None:
+        """Test that a new datamodule picks up the files added to the dataset since the previous scan."""
+        # the copy is made in the project directory, as the dataset paths must be inside the allowed directories.
+        with TemporaryDirectory(dir=dataset_path.parent) as tmp_dir:
+            root = Path(tmp_dir) / "dummy"
+            shutil.copytree(dataset_path / "mvtec_3d/dummy", root)
+
+            datamodule = self._create_datamodule(root, TaskType.SEGMENTATION)
+            datamodule.setup()
+            num_train_samples = len(datamodule.train_data)
+
+            # add an image and depth pair to the normal training images.
+            shutil.copy(next((root / "train/good/rgb").iterdir()), root / "train/good/rgb/new.png")
+            shutil.copy(next((root / "train/good/xyz").iterdir()), root / "train/good/xyz/new.tiff")
+
+            datamodule = self._create_datamodule(root, TaskType.SEGMENTATION)
+            datamodule.setup()
+            assert len(datamodule.train_data) == num_train_samples + 1
+
+    def test_extensions_list(self, dataset_path: Path) -> None:
+        """Test that the extensions can be passed as a list."""
+        datamodule = self._create_datamodule(
+            dataset_path / "mvtec_3d/dummy",
+            TaskType.SEGMENTATION,
+            extensions=[".png", ".tiff"],
+        )
+        datamodule.setup()
+        assert len(datamodule.train_data) > 0
@@ -6,6 +6,7 @@
 from pathlib import Path
 
 import pytest
+import torch
 
 from anomalib import TaskType
 from anomalib.data import MVTec
@@ -30,3 +31,21 @@ class TestMVTec(_TestAnomalibImageDatamodule):
         _datamodule.setup()
 
         return _datamodule
+
+    @staticmethod
+    def test_channels_last(dataset_path: Path) -> None:
+        """Test that the images are batched in channels-last memory format when requested."""
+        datamodule = MVTec(
+            root=dataset_path / "mvtec",
+            category="dummy",
+            image_size=256,
+            train_batch_size=4,
+            eval_batch_size=4,
+            num_workers=0,
+            channels_last=True,
+        )
+        datamodule.setup()
+
+        images = next(iter(datamodule.train_dataloader()))["image"]
+        assert images.is_contiguous(memory_format=torch.channels_last)
+        assert not images.is_contiguous()
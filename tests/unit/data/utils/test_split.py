@@ -0,0 +1,102 @@
+"""Tests for dataset splitting utils."""
+
+# Copyright (C) 2024 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+import math
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from anomalib import TaskType
+from anomalib.data import Folder
+from anomalib.data.image.folder import FolderDataset
+from anomalib.data.utils import (
+    TestSplitMode,
+    ValSplitMode,
+    get_subset_lengths,
+    get_transforms,
+    random_split,
+    random_split_by_lengths,
+)
+from anomalib.data.utils.synthetic import SyntheticAnomalyDataset
+
+
+@pytest.fixture(scope="module")
+def folder_dataset(dataset_path: Path) -> FolderDataset:
+    """Fixture that returns a FolderDataset instance."""
+    dataset = FolderDataset(
+        task=TaskType.CLASSIFICATION,
+        transform=get_transforms(image_size=(256, 256)),
+        root=dataset_path / "mvtec" / "dummy",
+        normal_dir="train/good",
+        split="train",
+    )
+    dataset.setup()
+    return dataset
+
+
+def _source_paths(dataset: FolderDataset) -> set[str]:
+    """Return the paths of the source images of a (synthetic) dataset."""
+    if isinstance(dataset, SyntheticAnomalyDataset):
+        return {dataset._source_paths.get(path, path) for path in dataset.samples.image_path}  # noqa: SLF001
+    return set(dataset.samples.image_path)
+
+
+@pytest.mark.parametrize("num_samples", [5, 9, 10, 17, 100])
+@pytest.mark.parametrize(("test_split_ratio", "val_split_ratio"), [(0.2, 0.5), (0.3, 0.3), (0.1, 0.25)])
+def test_subset_lengths_match_consecutive_splits(
+    folder_dataset: FolderDataset,
+    num_samples: int,
+    test_split_ratio: float,
+    val_split_ratio: float,
+) -> None:
+    """Tests if the lengths of a single split equal those of two consecutive calls to ``random_split``."""
+    # repeat the samples of the dummy dataset to obtain a dataset of the requested size
+    dataset = copy.deepcopy(folder_dataset)
+    num_repeats = math.ceil(num_samples / len(folder_dataset))
+    dataset.samples = pd.concat([folder_dataset.samples] * num_repeats, ignore_index=True).iloc[:num_samples]
+    train_data, test_data = random_split(dataset, test_split_ratio, seed=42)
+    train_data, val_data = random_split(train_data, val_split_ratio, seed=42)
+
+    train_length, test_length = get_subset_lengths(num_samples, [1 - test_split_ratio, test_split_ratio])
+    train_length, val_length = get_subset_lengths(train_length, [1 - val_split_ratio, val_split_ratio])
+    assert [train_length, test_length, val_length] == [len(train_data), len(test_data), len(val_data)]
+
+    subsets = random_split_by_lengths(dataset, [train_length, test_length, val_length], seed=42)
+    assert [len(subset) for subset in subsets] == [train_length, test_length, val_length]
+
+
+def test_synthetic_test_and_val_splits(dataset_path: Path, folder_dataset: FolderDataset) -> None:
+    """Tests if the train, synthetic test and synthetic val sets are sampled without overlap from the train images."""
+    datamodule = Folder(
+        root=dataset_path / "mvtec" / "dummy",
+        normal_dir="train/good",
+        abnormal_dir="test/bad",
+        image_size=(256, 256),
+        num_workers=0,
+        task=TaskType.CLASSIFICATION,
+        test_split_mode=TestSplitMode.SYNTHETIC,
+        test_split_ratio=0.2,
+        val_split_mode=ValSplitMode.SYNTHETIC,
+        val_split_ratio=0.5,
+        seed=42,
+    )
+    datamodule.setup()
+    num_train_images = len(folder_dataset)
+
+    train_length, test_length = get_subset_lengths(num_train_images, [0.8, 0.2])
+    train_length, val_length = get_subset_lengths(train_length, [0.5, 0.5])
+    assert len(datamodule.train_data) == train_length
+    assert len(datamodule.test_data) == test_length
+    assert len(datamodule.val_data) == val_length
+
+    train_paths = _source_paths(datamodule.train_data)
+    test_paths = _source_paths(datamodule.test_data)
+    val_paths = _source_paths(datamodule.val_data)
+    assert train_paths.isdisjoint(test_paths)
+    assert train_paths.isdisjoint(val_paths)
+    assert test_paths.isdisjoint(val_paths)
+    assert train_paths | test_paths | val_paths == set(folder_dataset.samples.image_path)
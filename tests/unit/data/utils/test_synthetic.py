@@ -51,7 +51,9 @@ class TestSyntheticAnomalyDataset:
     """Test SyntheticAnomalyDataset class."""
 
     def test_create_synthetic_dataset(self, synthetic_dataset: SyntheticAnomalyDataset) -> None:
-        """Tests if the image and mask files listed in the synthetic dataset exist."""
+        """Tests if the image and mask files listed in the synthetic dataset exist once the items are accessed."""
+        for index in range(len(synthetic_dataset)):
+            synthetic_dataset[index]
         assert all(Path(path).exists() for path in synthetic_dataset.samples.image_path)
         assert all(Path(path).exists() for path in synthetic_dataset.samples.mask_path)
 
@@ -60,6 +62,24 @@ class TestSyntheticAnomalyDataset:
         assert all(Path(path).exists() for path in synthetic_dataset_from_samples.samples.image_path)
         assert all(Path(path).exists() for path in synthetic_dataset_from_samples.samples.mask_path)
 
+    def test_lazy_generation(self, folder_dataset: FolderDataset) -> None:
+        """Tests if the synthetic anomalous images are only generated when they are accessed."""
+        synthetic_dataset = SyntheticAnomalyDataset.from_dataset(folder_dataset)
+        anomalous_index = synthetic_dataset.samples.label_index.tolist().index(1)
+        image_path = Path(synthetic_dataset.samples.image_path[anomalous_index])
+        assert not image_path.exists()
+        item = synthetic_dataset[anomalous_index]
+        assert image_path.exists()
+        assert item["image_path"] == str(image_path)
+
+    def test_single_image_source(self, folder_dataset: FolderDataset) -> None:
+        """Tests if a lazy synthetic dataset can be created from a source with too few images to augment."""
+        synthetic_dataset = SyntheticAnomalyDataset.from_dataset(folder_dataset.subsample([0]))
+        assert len(synthetic_dataset) == 1
+        assert (synthetic_dataset.samples.label_index == 0).all()
+        assert "source_path" not in synthetic_dataset.samples.columns
+        assert synthetic_dataset[0]["image_path"] == folder_dataset.samples.image_path[0]
+
     def test_copy(self, synthetic_dataset: SyntheticAnomalyDataset) -> None:
         """Tests if the dataset is copied correctly, and files still exist after original instance is deleted."""
         synthetic_dataset_cp = copy(synthetic_dataset)
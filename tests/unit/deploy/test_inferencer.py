@@ -3,18 +3,35 @@
 # Copyright (C) 2022-2024 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+import subprocess
+import sys
 from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
+from typing import Literal
+from unittest.mock import MagicMock
 
+import albumentations as A  # noqa: N812
+import cv2
 import numpy as np
 import pytest
 import torch
+from albumentations.pytorch import ToTensorV2
+from torch import nn
 
 from anomalib import TaskType
 from anomalib.data import MVTec
 from anomalib.deploy import ExportType, OpenVINOInferencer, TorchInferencer
+from anomalib.deploy.inferencers import base_inferencer
+from anomalib.deploy.inferencers.base_inferencer import Inferencer
 from anomalib.engine import Engine
 from anomalib.models import Padim
+from anomalib.utils.visualization import BatchImageResult, ImageResult
+
+# Size of the inputs of the stub models.
+_STUB_INPUT_SIZE = 64
 
 
 class _MockImageLoader:
@@ -46,6 +63,293 @@ class _MockImageLoader:
             yield self.image
 
 
+class _StubModel(nn.Module):
+    """Model whose anomaly map is the mean of the input channels, so that no backbone needs to be downloaded."""
+
+    def forward(self, image: torch.Tensor) -> torch.Tensor:
+        """Compute the anomaly map of a batch of images."""
+        return image.mean(dim=1, keepdim=True) * 2
+
+
+def _stub_metadata(task: TaskType, to_tensor: bool) -> dict:
+    """Metadata of the stub models, with thresholds in the middle of their output range."""
+    transforms = [A.Resize(_STUB_INPUT_SIZE, _STUB_INPUT_SIZE), A.Normalize(mean=0, std=1)]
+    if to_tensor:
+        transforms.append(ToTensorV2())
+    transform = A.Compose(transforms)
+    return {
+        "task": task,
+        "transform": A.to_dict(transform),
+        "image_threshold": 1.0,
+        "pixel_threshold": 1.0,
+        "min": 0.0,
+        "max": 2.0,
+    }
+
+
+def _stub_images(tmp_path: Path) -> list[np.ndarray | Path]:
+    """Random images of different sizes, half of which are read from files."""
+    rng = np.random.default_rng(0)
+    images: list[np.ndarray | Path] = []
+    for index, (height, width) in enumerate([(80, 90), (64, 64), (100, 70), (72, 96), (64, 80)]):
+        image = rng.integers(0, 255, (height, width, 3), dtype=np.uint8)
+        if index % 2:
+            path = tmp_path / f"{index}.png"
+            cv2.imwrite(str(path), cv2.cvtColor(image, cv2.COLOR_RGB2BGR))
+            images.append(path)
+        else:
+            images.append(image)
+    return images
+
+
+def _assert_same_results(inferencer: Inferencer, images: list[np.ndarray | Path]) -> None:
+    """Check that the multi-image prediction methods return the results of ``predict`` for each image."""
+    # predict may draw on the input array, so each call gets its own copy.
+    expected = [inferencer.predict(image if isinstance(image, Path) else image.copy()) for image in images]
+
+    def inputs() -> list[np.ndarray | Path]:
+        return [image if isinstance(image, Path) else image.copy() for image in images]
+
+    for results in (
+        inferencer.predict_batch(inputs()),
+        inferencer.predict_batch(inputs(), batch_size=2),
+        list(inferencer.predict_stream(inputs(), num_workers=2, prefetch=2)),
+        inferencer.predict_many(inputs()),
+    ):
+        assert len(results) == len(expected)
+        for result, expected_result in zip(results, expected, strict=True):
+            _assert_same_result(result, expected_result)
+
+
+def _assert_same_result(result: ImageResult, expected: ImageResult) -> None:
+    """Check that two prediction results are equal."""
+    assert result.pred_score == pytest.approx(expected.pred_score)
+    assert result.pred_label == expected.pred_label
+    np.testing.assert_array_equal(result.image, expected.image)
+    np.testing.assert_allclose(result.anomaly_map, expected.anomaly_map, rtol=1e-5, atol=1e-6)
+    np.testing.assert_array_equal(result.pred_mask, expected.pred_mask)
+    np.testing.assert_array_equal(result.pred_boxes, expected.pred_boxes)
+
+
+@pytest.mark.parametrize(
+    "device",
+    ["cpu", pytest.param("cuda", marks=pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA"))],
+)
+@pytest.mark.parametrize("task", [TaskType.CLASSIFICATION, TaskType.DETECTION, TaskType.SEGMENTATION])
+def test_torch_multi_image_inference(task: TaskType, device: str, tmp_path: Path) -> None:
+    """Test that batched and streamed Torch inference return the results of the per-image inference.
+
+    On CUDA, this also checks that the inputs are only used once their asynchronous copies to the device completed.
+    """
+    model_path = tmp_path / "model.pt"
+    torch.save({"model": _StubModel(), "metadata": _stub_metadata(task, to_tensor=True)}, model_path)
+    inferencer = TorchInferencer(path=model_path, device=device)
+
+    with torch.no_grad():
+        _assert_same_results(inferencer, _stub_images(tmp_path))
+
+
+@pytest.mark.parametrize("mixed_sizes", [False, True])
+def test_torch_batch_result(mixed_sizes: bool, tmp_path: Path) -> None:
+    """Test that the batch result built by ``predict_batch`` holds the per-image predictions."""
+    model_path = tmp_path / "model.pt"
+    torch.save({"model": _StubModel(), "metadata": _stub_metadata(TaskType.DETECTION, to_tensor=True)}, model_path)
+    inferencer = TorchInferencer(path=model_path, device="cpu")
+    rng = np.random.default_rng(0)
+    sizes = [(80, 90), (64, 64), (100, 70)] if mixed_sizes else [(80, 90)] * 3
+    images = [rng.integers(0, 255, (*size, 3), dtype=np.uint8) for size in sizes]
+
+    with torch.no_grad():
+        expected = BatchImageResult.from_results([inferencer.predict(image.copy()) for image in images])
+        result = inferencer.predict_batch([image.copy() for image in images], as_batch_result=True)
+
+    assert isinstance(result, BatchImageResult)
+    assert len(result) == len(images)
+    assert isinstance(result.anomaly_maps, list if mixed_sizes else np.ndarray)
+    assert isinstance(result.pred_masks, list if mixed_sizes else np.ndarray)
+    np.testing.assert_allclose(result.pred_scores, expected.pred_scores)
+    np.testing.assert_array_equal(result.pred_labels, expected.pred_labels)
+    for field in ("images", "anomaly_maps", "pred_masks", "pred_boxes", "box_labels"):
+        for array, expected_array in zip(getattr(result, field), getattr(expected, field), strict=True):
+            np.testing.assert_allclose(array, expected_array, rtol=1e-5, atol=1e-6)
+
+
+def test_torch_inference_cached_images(tmp_path: Path) -> None:
+    """Test that the cached images give the same results, and are not modified through the results."""
+    model_path = tmp_path / "model.pt"
+    torch.save({"model": _StubModel(), "metadata": _stub_metadata(TaskType.SEGMENTATION, to_tensor=True)}, model_path)
+    image_path = next(image for image in _stub_images(tmp_path) if isinstance(image, Path))
+    expected = TorchInferencer(path=model_path, device="cpu").predict(image_path)
+
+    inferencer = TorchInferencer(path=model_path, device="cpu", cache_images=True)
+    with torch.no_grad():
+        inferencer.predict(image_path).image[:] = 0
+        _assert_same_result(inferencer.predict(image_path), expected)
+
+
+def test_torch_inference_precision(tmp_path: Path) -> None:
+    """Test that the forward-pass runs in reduced precision, and that unsupported precisions are rejected."""
+    model_path = tmp_path / "model.pt"
+    torch.save({"model": _StubModel(), "metadata": _stub_metadata(TaskType.SEGMENTATION, to_tensor=True)}, model_path)
+    image = np.random.default_rng(0).integers(0, 255, (80, 90, 3), dtype=np.uint8)
+    expected = TorchInferencer(path=model_path, device="cpu").predict(image.copy())
+
+    with torch.no_grad():
+        result = TorchInferencer(path=model_path, device="cpu", precision="bf16").predict(image.copy())
+    assert result.anomaly_map.dtype == np.float32
+    np.testing.assert_allclose(result.anomaly_map, expected.anomaly_map, atol=1e-2)
+
+    with pytest.raises(ValueError, match="fp16"):
+        TorchInferencer(path=model_path, device="cpu", precision="fp16")
+    with pytest.raises(ValueError, match="Unknown precision"):
+        TorchInferencer(path=model_path, device="cpu", precision="int8")
+
+
+def test_predict_shm_from_another_process(tmp_path: Path) -> None:
+    """Test that predicting from shared memory in another process does not release the memory of its owner."""
+    model_path = tmp_path / "model.pt"
+    torch.save({"model": _StubModel(), "metadata": _stub_metadata(TaskType.SEGMENTATION, to_tensor=True)}, model_path)
+    image = np.random.default_rng(0).integers(0, 255, (80, 90, 3), dtype=np.uint8)
+    expected = TorchInferencer(path=model_path, device="cpu").predict(image.copy())
+
+    owner = SharedMemory(create=True, size=image.nbytes)
+    try:
+        np.ndarray(image.shape, dtype=image.dtype, buffer=owner.buf)[:] = image
+        # the inference runs in a separate interpreter, as a web server worker would, with its own resource tracker.
+        code = (
+            "from anomalib.deploy import TorchInferencer\n"
+            f"inferencer = TorchInferencer(path={str(model_path)!r}, device='cpu')\n"
+            f"print(inferencer.predict_shm({owner.name!r}, {image.shape!r}).pred_score)\n"
+        )
+        process = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+        assert float(process.stdout.splitlines()[-1]) == pytest.approx(expected.pred_score)
+        assert "leaked shared_memory" not in process.stderr
+
+        # the shared memory is still available to its owner.
+        SharedMemory(name=owner.name).close()
+    finally:
+        owner.close()
+        owner.unlink()
+
+
+def _write_jpeg(
+    path: Path,
+    image: np.ndarray,
+    orientation: int | None = None,
+    byteorder: Literal["little", "big"] = "little",
+) -> None:
+    """Write an RGB image to a JPEG file, optionally with an EXIF orientation."""
+    jpeg = cv2.imencode(".jpg", cv2.cvtColor(image, cv2.COLOR_RGB2BGR))[1].tobytes()
+    if orientation is not None:
+        # TIFF header and a directory of two entries stored as shorts, the image width followed by the orientation.
+        tiff = (
+            (b"II*\0" if byteorder == "little" else b"MM\0*") + (8).to_bytes(4, byteorder) + (2).to_bytes(2, byteorder)
+        )
+        for tag, value in ((0x0100, image.shape[1]), (0x0112, orientation)):
+            tiff += tag.to_bytes(2, byteorder) + (3).to_bytes(2, byteorder) + (1).to_bytes(4, byteorder)
+            tiff += value.to_bytes(2, byteorder) + bytes(2)
+        tiff += bytes(4)
+        exif = b"Exif\0\0" + tiff
+        jpeg = jpeg[:2] + b"\xff\xe1" + (len(exif) + 2).to_bytes(2, "big") + exif + jpeg[2:]
+    path.write_bytes(jpeg)
+
+
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+@pytest.mark.parametrize("orientation", [None, 1, 3, 6, 8])
+def test_exif_orientation(orientation: int | None, byteorder: Literal["little", "big"], tmp_path: Path) -> None:
+    """Test that the EXIF orientation is parsed from the little- and big-endian EXIF data."""
+    path = tmp_path / "image.jpg"
+    _write_jpeg(path, np.zeros((32, 48, 3), dtype=np.uint8), orientation, byteorder)
+    assert base_inferencer._exif_orientation(path.read_bytes()) == (orientation or 1)  # noqa: SLF001
+
+
+@pytest.mark.parametrize(
+    ("orientation", "colorspace", "uses_turbojpeg"),
+    [(None, 1, True), (1, 1, True), (6, 1, False), (None, 3, False)],
+)
+def test_turbojpeg_decoding(
+    orientation: int | None,
+    colorspace: int,
+    uses_turbojpeg: bool,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that TurboJPEG only decodes the JPEG images that it decodes like OpenCV.
+
+    Rotated images (EXIF orientation 6) and CMYK images (colorspace 3) are decoded with OpenCV.
+    """
+    image = np.zeros((32, 48, 3), dtype=np.uint8)
+    path = tmp_path / "image.jpg"
+    _write_jpeg(path, image, orientation)
+
+    decoder = MagicMock()
+    decoder.decode_header.return_value = (48, 32, 0, colorspace)
+    decoder.decode.return_value = image
+    monkeypatch.setattr(base_inferencer, "_get_jpeg_decoder", lambda: decoder)
+    for name, value in (("TJPF_RGB", 0), ("TJCS_CMYK", 3), ("TJCS_YCCK", 4)):
+        monkeypatch.setattr(base_inferencer, name, value, raising=False)
+
+    decoded = base_inferencer._read_image(str(path))  # noqa: SLF001
+    assert decoder.decode.called == uses_turbojpeg
+    # OpenCV applies the EXIF orientation, which rotates the image by 90 degrees.
+    assert decoded.shape == ((48, 32, 3) if orientation == 6 else (32, 48, 3))
+
+
+@pytest.mark.parametrize(("orientation", "byteorder"), [(None, "little"), (6, "little"), (8, "big")])
+def test_turbojpeg_matches_opencv(orientation: int | None, byteorder: Literal["little", "big"], tmp_path: Path) -> None:
+    """Test that the images decoded with TurboJPEG match those decoded with OpenCV."""
+    if base_inferencer._get_jpeg_decoder() is None:  # noqa: SLF001
+        pytest.skip("TurboJPEG is not installed.")
+    rng = np.random.default_rng(42)
+    image = cv2.resize(rng.integers(0, 256, size=(8, 12, 3), dtype=np.uint8), (48, 32))
+    path = tmp_path / "image.jpg"
+    _write_jpeg(path, image, orientation, byteorder)
+
+    decoded = base_inferencer._read_image(str(path))  # noqa: SLF001
+    expected = cv2.cvtColor(cv2.imread(str(path)), cv2.COLOR_BGR2RGB)
+    assert decoded.shape == expected.shape
+    # the IDCT of the libjpeg-turbo library bundled with OpenCV may round differently.
+    assert np.abs(decoded.astype(np.int16) - expected).max() <= 1
+
+
+def _openvino_stub_inferencer(task: TaskType, tmp_path: Path) -> OpenVINOInferencer:
+    """Create an OpenVINO inferencer of the stub model."""
+    ov = pytest.importorskip("openvino.runtime")
+    ops = ov.opset8
+
+    image = ops.parameter(ov.PartialShape([-1, 3, _STUB_INPUT_SIZE, _STUB_INPUT_SIZE]), ov.Type.f32, name="input")
+    channel_mean = ops.reduce_mean(image, ops.constant(np.array([1])), keep_dims=True)
+    anomaly_map = ops.multiply(channel_mean, ops.constant(np.float32(2)))
+    model_path = tmp_path / "model.xml"
+    ov.serialize(ov.Model([anomaly_map], [image], "stub"), str(model_path), str(tmp_path / "model.bin"))
+    metadata_path = tmp_path / "metadata.json"
+    metadata_path.write_text(json.dumps(_stub_metadata(task, to_tensor=False)))
+
+    return OpenVINOInferencer(model_path, metadata_path, device="CPU", task=task)
+
+
+@pytest.mark.parametrize("task", [TaskType.CLASSIFICATION, TaskType.DETECTION, TaskType.SEGMENTATION])
+def test_openvino_multi_image_inference(task: TaskType, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that batched, streamed and asynchronous OpenVINO inference return the results of the per-image inference."""
+    # the inferencer caches the compiled model in the working directory.
+    monkeypatch.chdir(tmp_path)
+    inferencer = _openvino_stub_inferencer(task, tmp_path)
+    _assert_same_results(inferencer, _stub_images(tmp_path))
+
+
+def test_openvino_concurrent_predict_many(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that concurrent asynchronous predictions on a shared inferencer do not mix up their results."""
+    monkeypatch.chdir(tmp_path)
+    inferencer = _openvino_stub_inferencer(TaskType.SEGMENTATION, tmp_path)
+    rng = np.random.default_rng(0)
+    image_lists = [[rng.integers(0, 255, (64, 64, 3), dtype=np.uint8) for _ in range(16)] for _ in range(4)]
+    expected = [[inferencer.predict(image.copy()).pred_score for image in images] for images in image_lists]
+
+    with ThreadPoolExecutor(max_workers=len(image_lists)) as executor:
+        results = list(executor.map(inferencer.predict_many, image_lists))
+    assert [[result.pred_score for result in image_results] for image_results in results] == expected
+
+
 @pytest.mark.parametrize(
     "task",
     [
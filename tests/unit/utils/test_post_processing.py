@@ -0,0 +1,23 @@
+"""Tests for the post-processing utils."""
+
+# Copyright (C) 2024 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+from anomalib.utils.post_processing import compute_mask
+
+
+@pytest.mark.parametrize("threshold", [-1, 0, 1, 64, 127.5, 128, 200.25, 254.9, 255, 300])
+def test_compute_mask_uint8(threshold: float) -> None:
+    """Tests if a uint8 anomaly map is thresholded the same way as the equivalent float map."""
+    rng = np.random.default_rng(42)
+    anomaly_map = rng.integers(0, 256, size=(64, 64), dtype=np.uint8)
+    # add a large uniform region so that the morphological opening keeps part of the mask
+    anomaly_map[16:48, 16:48] = 160
+
+    mask = compute_mask(anomaly_map, threshold)
+    expected_mask = compute_mask(anomaly_map.astype(np.float32), threshold)
+    assert mask.dtype == expected_mask.dtype
+    np.testing.assert_array_equal(mask, expected_mask)